@@ -1,14 +1,28 @@
+import asyncio
 import inspect
-import ast
+import hashlib
 import importlib
+import string
 import sys
+import types
+import weakref
+from collections import OrderedDict
 from io import StringIO
 from typing import Dict, List, Any
 
+# Maximum number of compiled agent modules kept in the code cache
+CODE_CACHE_SIZE = 256
+
 class AgentFactory:
     def __init__(self):
         self.agent_templates = self._load_agent_templates()
         self.capability_library = self._load_capability_library()
+        self._template_fragments, self._template_order = self._split_template(
+            self.agent_templates['advanced_agent']
+        )
+        self._code_cache: 'OrderedDict[bytes, types.CodeType]' = OrderedDict()
+        self._source_cache: 'OrderedDict[tuple, str]' = OrderedDict()
+        self._class_cache: Dict[tuple, type] = {}
         
     async def create_specialized_agent(self, agent_spec: Dict) -> Any:
         """Dynamically create specialized AI agents"""
@@ -17,7 +31,7 @@ class AgentFactory:
         agent_code = await self._generate_agent_code(agent_spec)
         
         # Validate code syntax
-        self._validate_agent_code(agent_code)
+        self._validate_agent_code(agent_code, agent_spec['name'])
         
         # Create agent class dynamically
         agent_class = self._compile_agent_class(agent_code, agent_spec['name'])
@@ -25,33 +39,78 @@ class AgentFactory:
         # Initialize agent with capabilities
         agent_instance = agent_class(
             capabilities=agent_spec['capabilities'],
-            configuration=agent_spec.get('configuration', {})
+            configuration={'factory': weakref.proxy(self), **agent_spec.get('configuration', {})}
         )
         
         return agent_instance
     
+    def _validate_agent_code(self, code: str, class_name: str):
+        """Validate generated code by compiling it; the code object is cached for reuse"""
+        
+        # Raises SyntaxError for invalid source
+        self._compile_source(code, class_name)
+    
     def _compile_agent_class(self, code: str, class_name: str) -> Any:
         """Dynamically compile agent class from generated code"""
         
+        # Reuse the class built from an identical source
+        cache_key = (self._source_digest(code), class_name)
+        agent_class = self._class_cache.get(cache_key)
+        if agent_class is not None:
+            return agent_class
+        
         # Create module namespace
         module_namespace = {}
         
-        # Execute code in namespace
-        exec(code, module_namespace)
+        # Execute cached code object in namespace
+        exec(self._compile_source(code, class_name), module_namespace)
         
         # Extract the agent class
         agent_class = module_namespace[class_name]
         
+        self._class_cache[cache_key] = agent_class
+        if len(self._class_cache) > CODE_CACHE_SIZE:
+            del self._class_cache[next(iter(self._class_cache))]
+        
         return agent_class
     
+    @staticmethod
+    def _source_digest(code: str) -> bytes:
+        """Stable digest of generated source used as a cache key"""
+        return hashlib.blake2b(code.encode(), digest_size=16).digest()
+    
+    def _compile_source(self, code: str, class_name: str) -> types.CodeType:
+        """Compile generated source once and reuse the code object for identical sources"""
+        
+        key = self._source_digest(code)
+        code_obj = self._code_cache.get(key)
+        
+        if code_obj is None:
+            code_obj = compile(code, f"<agent:{class_name}>", "exec")
+            self._code_cache[key] = code_obj
+            if len(self._code_cache) > CODE_CACHE_SIZE:
+                self._code_cache.popitem(last=False)
+        else:
+            self._code_cache.move_to_end(key)
+        
+        return code_obj
+    
     async def _generate_agent_code(self, agent_spec: Dict) -> str:
         """Generate complete agent implementation code"""
         
-        capabilities_code = await self._generate_capabilities_code(agent_spec['capabilities'])
-        learning_code = await self._generate_learning_mechanisms(agent_spec)
-        communication_code = await self._generate_communication_protocols(agent_spec)
+        spec_key = self._spec_key(agent_spec)
+        cached_source = self._source_cache.get(spec_key)
+        if cached_source is not None:
+            self._source_cache.move_to_end(spec_key)
+            return cached_source
         
-        agent_template = self.agent_templates['advanced_agent'].format(
+        capabilities_code, learning_code, communication_code = await asyncio.gather(
+            self._generate_capabilities_code(agent_spec['capabilities']),
+            self._generate_learning_mechanisms(agent_spec),
+            self._generate_communication_protocols(agent_spec)
+        )
+        
+        agent_template = self._render_template(
             class_name=agent_spec['name'].title().replace('_', ''),
             capabilities_code=capabilities_code,
             learning_code=learning_code,
@@ -59,17 +118,81 @@ class AgentFactory:
             autonomy_level=agent_spec.get('autonomy_level', 'medium')
         )
         
+        self._source_cache[spec_key] = agent_template
+        if len(self._source_cache) > CODE_CACHE_SIZE:
+            self._source_cache.popitem(last=False)
         return agent_template
+    
+    @staticmethod
+    def _split_template(template: str) -> tuple:
+        """Split a format template into literal fragments and the field names between them"""
+        
+        fragments = []
+        order = []
+        literal = []
+        for literal_text, field_name, format_spec, conversion in string.Formatter().parse(template):
+            literal.append(literal_text)
+            if field_name is None:
+                continue
+            if format_spec or conversion:
+                raise ValueError(f"Unsupported template field: {field_name}")
+            fragments.append(''.join(literal))
+            order.append(field_name)
+            literal = []
+        fragments.append(''.join(literal))
+        
+        return fragments, order
+    
+    def _render_template(self, **values) -> str:
+        """Render the agent template by concatenating precomputed fragments"""
+        
+        fragments = self._template_fragments
+        parts = [fragments[0]]
+        for index, field_name in enumerate(self._template_order, 1):
+            parts.append(str(values[field_name]))
+            parts.append(fragments[index])
+        
+        return ''.join(parts)
+    
+    @classmethod
+    def _spec_key(cls, agent_spec: Dict) -> tuple:
+        """Build a hashable cache key describing the shape of an agent spec"""
+        return (
+            agent_spec['name'],
+            cls._freeze(agent_spec['capabilities']),
+            agent_spec.get('autonomy_level', 'medium'),
+            cls._freeze(agent_spec.get('configuration', {})),
+            cls._freeze({k: v for k, v in agent_spec.items()
+                         if k not in ('name', 'capabilities', 'autonomy_level', 'configuration')})
+        )
+    
+    @classmethod
+    def _freeze(cls, value: Any) -> Any:
+        """Recursively convert dicts/lists/sets into hashable equivalents"""
+        if isinstance(value, dict):
+            return tuple(sorted((k, cls._freeze(v)) for k, v in value.items()))
+        if isinstance(value, (list, tuple)):
+            return tuple(cls._freeze(v) for v in value)
+        if isinstance(value, (set, frozenset)):
+            return frozenset(cls._freeze(v) for v in value)
+        try:
+            hash(value)
+        except TypeError:
+            return repr(value)
+        return value
 
 class SelfEvolvingAgent:
     """Base class for self-evolving agents"""
     
+    __slots__ = ('capabilities', 'configuration', 'performance_metrics', 'learning_data', 'evolution_triggers', '_factory')
+    
     def __init__(self, capabilities: Dict, configuration: Dict):
         self.capabilities = capabilities
         self.configuration = configuration
         self.performance_metrics = {}
         self.learning_data = []
         self.evolution_triggers = configuration.get('evolution_triggers', [])
+        self._factory = configuration.get('factory')
         
     async def evolve_capability(self, capability_name: str, performance_data: Dict):
         """Evolve specific capability based on performance"""
@@ -78,7 +201,7 @@ class SelfEvolvingAgent:
             evolution_plan = await self.create_evolution_plan(capability_name, performance_data)
             await self.execute_evolution(evolution_plan)
             
-    async self_replicate(self, new_specifications: Dict) -> str:
+    async def self_replicate(self, new_specifications: Dict) -> str:
         """Create a new evolved version of itself"""
         
         new_capabilities = self._merge_capabilities(self.capabilities, new_specifications)
@@ -88,4 +211,4 @@ class SelfEvolvingAgent:
             'configuration': self._update_configuration(new_specifications)
         }
         
-        return await agent_factory.create_specialized_agent(new_agent_spec)
+        return await self._factory.create_specialized_agent(new_agent_spec)
@@ -1,114 +1,286 @@
-import uuid
+import secrets
 import asyncio
+import functools
 import json
-from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, Any, Optional
 from datetime import datetime
 import logging
 
-class BaseAgent(ABC):
+# Shared logger for all agents; handlers and levels are left to the application
+_AGENT_LOGGER = logging.getLogger("agents")
+_AGENT_LOGGER.addHandler(logging.NullHandler())
+
+# Task/result keys and values used on the per-task path
+_K_TYPE = sys.intern('type')
+_K_TASK_ID = sys.intern('task_id')
+_K_STATUS = sys.intern('status')
+_K_ERROR = sys.intern('error')
+_V_UNKNOWN = sys.intern('unknown')
+_V_ERROR = sys.intern('error')
+_V_SUCCESS = sys.intern('success')
+
+def _required(method):
+    """Mark a method that concrete agent classes must override"""
+    method._required = True
+    return method
+
+# Worker process pools shared by all agents, keyed by pool size
+_WORKER_POOLS: Dict[int, ProcessPoolExecutor] = {}
+
+def _worker_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Return the shared worker pool of the given size, creating it on first use"""
+    pool = _WORKER_POOLS.get(max_workers)
+    if pool is None:
+        pool = _WORKER_POOLS[max_workers] = ProcessPoolExecutor(max_workers=max_workers)
+    return pool
+
+def _process_task_in_worker(agent_factory: Callable[[], 'BaseAgent'], config: Dict[str, Any],
+                            memory: Dict[str, Any], task: Dict[str, Any]):
+    """Run a task inside a worker process on an agent built by agent_factory; returns (result, execution_time, success)"""
+    start_time = time.perf_counter()
+    try:
+        agent = agent_factory()
+        agent.config = config
+        agent.memory = memory
+        result = asyncio.run(agent.process_task(task))
+        return result, time.perf_counter() - start_time, True
+    except Exception as e:
+        return {_K_ERROR: str(e)}, time.perf_counter() - start_time, False
+
+class _AgentLoggerAdapter(logging.LoggerAdapter):
+    """Prefix each message with the agent's class and id, so any formatter can render it"""
+    
+    def process(self, msg, kwargs):
+        kwargs["extra"] = self.extra
+        return f"{self.extra['agent_class']}_{self.extra['agent_id']} - {msg}", kwargs
+
+class BaseAgent:
     """Base class for all AI agents in the system"""
     
+    __slots__ = (
+        'agent_id', 'name', '_capabilities', '_capability_set', 'config', 'memory',
+        '_task_type_index', '_type_total', '_type_successful', '_type_time', '_total_tasks', '_total_successful', '_metrics_view', 'learning_rate',
+        'autonomy_level', 'is_active', '_task_queue', 'logger', '_report_header'
+    )
+    
     def __init__(self, agent_id: str, name: str, capabilities: List[str], config: Dict[str, Any]):
-        self.agent_id = agent_id or f"agent_{uuid.uuid4().hex[:8]}"
+        self.agent_id = agent_id or f"agent_{secrets.token_hex(4)}"
         self.name = name
         self.capabilities = capabilities
         self.config = config
         self.memory = {}
-        self.performance_metrics = {}
+        self._task_type_index = {}
+        self._type_total = array('Q')
+        self._type_successful = array('Q')
+        self._type_time = array('d')
+        self._total_tasks = 0
+        self._total_successful = 0
+        self._metrics_view = None
         self.learning_rate = config.get('learning_rate', 0.1)
         self.autonomy_level = config.get('autonomy_level', 'medium')
         self.is_active = False
-        self.task_queue = asyncio.Queue()
+        self._task_queue = None
         self.logger = self._setup_logging()
         
+    def __init_subclass__(cls, abstract: bool = False, **kwargs):
+        """Check once per class, not per instance, that required methods are implemented"""
+        super().__init_subclass__(**kwargs)
+        if abstract:
+            return
+        
+        missing = [name for name in dir(cls) if getattr(getattr(cls, name, None), '_required', False)]
+        if missing:
+            raise TypeError(
+                f"Can't define agent class {cls.__name__} without implementing: {', '.join(sorted(missing))}"
+            )
+        
     def _setup_logging(self):
-        logger = logging.getLogger(f"{self.__class__.__name__}_{self.agent_id}")
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        logger.setLevel(logging.INFO)
-        return logger
+        return _AgentLoggerAdapter(_AGENT_LOGGER, {
+            'agent_class': self.__class__.__name__,
+            'agent_id': self.agent_id
+        })
+
+    @property
+    def capabilities(self) -> List[str]:
+        return self._capabilities
+
+    @capabilities.setter
+    def capabilities(self, capabilities: List[str]):
+        self._capabilities = capabilities
+        self._capability_set = frozenset(capabilities)
+        self._report_header = None
+
+    @property
+    def task_queue(self) -> asyncio.Queue:
+        """Task queue, created on first use"""
+        if self._task_queue is None:
+            self._task_queue = asyncio.Queue()
+        return self._task_queue
 
-    @abstractmethod
+    @_required
     async def process_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Process a task - to be implemented by subclasses"""
         pass
 
-    @abstractmethod
+    @_required
     async def learn_from_experience(self, experience: Dict[str, Any]):
         """Learn from previous experiences"""
         pass
 
     async def execute(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a task with error handling and performance tracking"""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
+        task_type = task.get(_K_TYPE, _V_UNKNOWN)
         
         try:
-            self.logger.info(f"Agent {self.name} starting task: {task.get('type', 'unknown')}")
+            self.logger.info("Agent %s starting task: %s", self.name, task_type)
             result = await self.process_task(task)
             
             # Track performance
-            execution_time = (datetime.now() - start_time).total_seconds()
-            self._update_performance_metrics(task, result, execution_time, True)
+            execution_time = time.perf_counter() - start_time
+            self._update_performance_metrics(task_type, result, execution_time, True)
             
             return result
             
         except Exception as e:
-            self.logger.error(f"Agent {self.name} failed task: {str(e)}")
-            execution_time = (datetime.now() - start_time).total_seconds()
-            self._update_performance_metrics(task, {"error": str(e)}, execution_time, False)
+            self.logger.error("Agent %s failed task: %s", self.name, e)
+            execution_time = time.perf_counter() - start_time
+            self._update_performance_metrics(task_type, {_K_ERROR: str(e)}, execution_time, False)
             
             return {
-                "status": "error",
-                "error": str(e),
+                _K_STATUS: _V_ERROR,
+                _K_ERROR: str(e),
                 "agent_id": self.agent_id,
-                "task_id": task.get('task_id', 'unknown')
+                _K_TASK_ID: task.get(_K_TASK_ID, _V_UNKNOWN)
             }
 
-    def _update_performance_metrics(self, task: Dict, result: Dict, execution_time: float, success: bool):
-        """Update agent performance metrics"""
-        task_type = task.get('type', 'unknown')
-        
-        if task_type not in self.performance_metrics:
-            self.performance_metrics[task_type] = {
-                'total_tasks': 0,
-                'successful_tasks': 0,
-                'total_execution_time': 0,
-                'average_execution_time': 0
+    def _worker_factory(self) -> Callable[[], 'BaseAgent']:
+        """Picklable callable that builds an equivalent agent in a worker process
+        
+        The default passes this agent's id to the class constructor; agents whose
+        constructors take other arguments override this.
+        """
+        return functools.partial(self.__class__, self.agent_id)
+
+    async def execute_batch(self, tasks: List[Dict[str, Any]], max_workers: int = 8,
+                            agent_factory: Optional[Callable[[], 'BaseAgent']] = None) -> List[Dict[str, Any]]:
+        """Execute CPU-bound tasks in parallel worker processes
+        
+        Each task runs on an agent built by agent_factory (default: _worker_factory())
+        that is given copies of this agent's config and memory; changes made in the
+        workers are not copied back. Performance metrics are recorded on this agent.
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        
+        if agent_factory is None:
+            agent_factory = self._worker_factory()
+        
+        loop = asyncio.get_running_loop()
+        executor = _worker_pool(max_workers)
+        
+        try:
+            outcomes = await asyncio.gather(*[
+                loop.run_in_executor(executor, _process_task_in_worker, agent_factory, self.config, self.memory, task)
+                for task in tasks
+            ])
+        except BrokenProcessPool:
+            # A worker died; drop the pool so the next batch starts a fresh one
+            _WORKER_POOLS.pop(max_workers, None)
+            raise
+        
+        results = []
+        for task, (result, execution_time, success) in zip(tasks, outcomes):
+            self._update_performance_metrics(task.get(_K_TYPE, _V_UNKNOWN), result, execution_time, success)
+            if not success:
+                self.logger.error("Agent %s failed task: %s", self.name, result[_K_ERROR])
+                result = {
+                    _K_STATUS: _V_ERROR,
+                    _K_ERROR: result[_K_ERROR],
+                    "agent_id": self.agent_id,
+                    _K_TASK_ID: task.get(_K_TASK_ID, _V_UNKNOWN)
+                }
+            results.append(result)
+        
+        return results
+
+    async def _safe_execute(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute a task, reporting any escaping exception as an error result"""
+        try:
+            return await self.execute(task)
+        except Exception as e:
+            return {
+                _K_STATUS: _V_ERROR,
+                _K_ERROR: repr(e),
+                "agent_id": self.agent_id,
+                _K_TASK_ID: task.get(_K_TASK_ID, _V_UNKNOWN)
             }
+
+    def _update_performance_metrics(self, task_type: str, result: Dict, execution_time: float, success: bool):
+        """Update agent performance metrics"""
+        index = self._task_type_index.get(task_type)
+        if index is None:
+            index = self._task_type_index[task_type] = len(self._type_total)
+            self._type_total.append(0)
+            self._type_successful.append(0)
+            self._type_time.append(0.0)
         
-        metrics = self.performance_metrics[task_type]
-        metrics['total_tasks'] += 1
-        metrics['total_execution_time'] += execution_time
-        metrics['average_execution_time'] = metrics['total_execution_time'] / metrics['total_tasks']
+        self._type_total[index] += 1
+        self._type_time[index] += execution_time
+        self._total_tasks += 1
         
         if success:
-            metrics['successful_tasks'] += 1
+            self._type_successful[index] += 1
+            self._total_successful += 1
+        
+        self._metrics_view = None
+
+    @property
+    def performance_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Per task type metrics built from the parallel counter arrays
+        
+        The view is cached until the next recorded task; callers must not modify it.
+        """
+        if self._metrics_view is None:
+            self._metrics_view = {
+                task_type: {
+                    'total_tasks': self._type_total[index],
+                    'successful_tasks': self._type_successful[index],
+                    'total_execution_time': self._type_time[index],
+                    'average_execution_time': self._type_time[index] / self._type_total[index]
+                }
+                for task_type, index in self._task_type_index.items()
+            }
+        return self._metrics_view
 
     def get_performance_report(self) -> Dict[str, Any]:
         """Generate performance report for the agent"""
+        if self._report_header is None:
+            # Invariant part of the report, built once (reset when capabilities change)
+            self._report_header = {
+                'agent_id': self.agent_id,
+                'name': self.name,
+                'capabilities': self.capabilities
+            }
+        
         return {
-            'agent_id': self.agent_id,
-            'name': self.name,
-            'capabilities': self.capabilities,
+            **self._report_header,
             'performance_metrics': self.performance_metrics,
             'success_rate': self._calculate_success_rate(),
-            'total_tasks_processed': sum(m['total_tasks'] for m in self.performance_metrics.values())
+            'total_tasks_processed': self._total_tasks
         }
 
     def _calculate_success_rate(self) -> float:
         """Calculate overall success rate across all task types"""
-        if not self.performance_metrics:
+        if not self._total_tasks:
             return 0.0
-            
-        total_tasks = sum(m['total_tasks'] for m in self.performance_metrics.values())
-        successful_tasks = sum(m['successful_tasks'] for m in self.performance_metrics.values())
         
-        return (successful_tasks / total_tasks) * 100 if total_tasks > 0 else 0.0
+        return (self._total_successful / self._total_tasks) * 100
 
     async def self_improve(self) -> Dict[str, Any]:
         """Self-improvement mechanism for the agent"""
@@ -126,29 +298,32 @@ class BaseAgent(ABC):
         """Identify areas where the agent needs improvement"""
         improvement_areas = []
         
-        for task_type, metrics in self.performance_metrics.items():
-            success_rate = (metrics['successful_tasks'] / metrics['total_tasks']) * 100
+        for task_type, index in self._task_type_index.items():
+            total_tasks = self._type_total[index]
+            success_rate = (self._type_successful[index] / total_tasks) * 100
             if success_rate < 80:  # Threshold for improvement
                 improvement_areas.append(f"success_rate_{task_type}")
                 
-            if metrics['average_execution_time'] > 30:  # More than 30 seconds average
+            if self._type_time[index] / total_tasks > 30:  # More than 30 seconds average
                 improvement_areas.append(f"efficiency_{task_type}")
                 
         return improvement_areas
 
-    @abstractmethod
+    @_required
     async def _create_improvement_plan(self, area: str) -> Dict[str, Any]:
         """Create improvement plan for specific area"""
         pass
 
-    @abstractmethod
+    @_required
     async def _implement_improvement(self, plan: Dict[str, Any]) -> Dict[str, Any]:
         """Implement improvement plan"""
         pass
 
-class CollaborativeAgent(BaseAgent):
+class CollaborativeAgent(BaseAgent, abstract=True):
     """Base class for agents that can collaborate with others"""
     
+    __slots__ = ('collaboration_network', 'communication_protocols')
+    
     def __init__(self, agent_id: str, name: str, capabilities: List[str], config: Dict[str, Any]):
         super().__init__(agent_id, name, capabilities, config)
         self.collaboration_network = {}
@@ -156,9 +331,9 @@ class CollaborativeAgent(BaseAgent):
         
     async def collaborate(self, other_agent: BaseAgent, task: Dict[str, Any]) -> Dict[str, Any]:
         """Collaborate with another agent on a task"""
-        collaboration_id = f"collab_{uuid.uuid4().hex[:8]}"
+        collaboration_id = f"collab_{secrets.token_hex(4)}"
         
-        self.logger.info(f"Initiating collaboration {collaboration_id} with {other_agent.name}")
+        self.logger.info("Initiating collaboration %s with %s", collaboration_id, other_agent.name)
         
         # Establish communication channel
         communication_channel = await self._establish_communication(other_agent)
@@ -168,9 +343,8 @@ class CollaborativeAgent(BaseAgent):
         
         # Execute subtasks in parallel
         results = await asyncio.gather(
-            self.execute(task_division['subtask_1']),
-            other_agent.execute(task_division['subtask_2']),
-            return_exceptions=True
+            self._safe_execute(task_division['subtask_1']),
+            other_agent._safe_execute(task_division['subtask_2'])
         )
         
         # Synthesize results
@@ -184,7 +358,7 @@ class CollaborativeAgent(BaseAgent):
     async def _establish_communication(self, other_agent: BaseAgent) -> Dict[str, Any]:
         """Establish communication channel with another agent"""
         return {
-            'channel_id': f"comm_{uuid.uuid4().hex[:8]}",
+            'channel_id': f"comm_{secrets.token_hex(4)}",
             'agents': [self.agent_id, other_agent.agent_id],
             'protocol': self.communication_protocols.get('default', 'direct'),
             'established_at': datetime.now().isoformat()
@@ -193,8 +367,8 @@ class CollaborativeAgent(BaseAgent):
     async def _divide_task(self, task: Dict[str, Any], other_agent: BaseAgent) -> Dict[str, Any]:
         """Divide task based on agent capabilities"""
         # Simple division based on capabilities match
-        our_capabilities = set(self.capabilities)
-        their_capabilities = set(other_agent.capabilities)
+        our_capabilities = self._capability_set
+        their_capabilities = other_agent._capability_set
         
         common_capabilities = our_capabilities.intersection(their_capabilities)
         our_unique = our_capabilities - their_capabilities
@@ -215,23 +389,28 @@ class CollaborativeAgent(BaseAgent):
 
     async def _synthesize_results(self, results: List[Dict], original_task: Dict) -> Dict[str, Any]:
         """Synthesize results from multiple agents"""
-        successful_results = [r for r in results if not isinstance(r, Exception) and r.get('status') != 'error']
+        successful_results = []
+        total_results = 0
+        for r in results:
+            total_results += 1
+            if r.get(_K_STATUS) != _V_ERROR:
+                successful_results.append(r)
         
         if not successful_results:
             return {
-                'status': 'error',
+                _K_STATUS: _V_ERROR,
                 'message': 'All collaborative agents failed',
                 'individual_results': results
             }
             
         return {
-            'status': 'success',
+            _K_STATUS: _V_SUCCESS,
             'synthesized_result': await self._merge_results(successful_results),
             'individual_results': results,
-            'collaboration_success_rate': len(successful_results) / len(results) * 100
+            'collaboration_success_rate': len(successful_results) / total_results * 100
         }
 
-    @abstractmethod
+    @_required
     async def _merge_results(self, results: List[Dict]) -> Dict[str, Any]:
         """Merge multiple results into a cohesive output"""
         pass
@@ -0,0 +1,23 @@
+"""Numeric kernels for market analysis, JIT-compiled with Numba when it is installed"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback that leaves the kernel as plain Python"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+@njit(cache=True)
+def compute_shares(is_leader):
+    """Market share per player: leaders get 40%, every other player splits 60% over n - 1"""
+    n = is_leader.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    rest = 0.6 / (n - 1) if n > 1 else 0.6
+    
+    for i in range(n):
+        out[i] = 0.4 if is_leader[i] else rest
+    
+    return out
@@ -1,11 +1,234 @@
 import asyncio
-from typing import Dict, List, Any
+import sys
+from collections import defaultdict
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+from typing import Dict, List, Any, NamedTuple
 from datetime import datetime, timedelta
 from ..base_agent import CollaborativeAgent
 
+# Interned values compared on every analysis
+MARKET_LEADER = sys.intern('market_leader')
+SEVERITY_HIGH = sys.intern('high')
+
+# Static market lookup tables, keyed by lower-cased industry / geography.
+# This would integrate with real data sources in production.
+_INDUSTRY_MULTIPLIERS = MappingProxyType({
+    'technology': 1000000000,
+    'healthcare': 500000000,
+    'finance': 750000000,
+    'retail': 300000000
+})
+
+_GEOGRAPHY_MULTIPLIERS = MappingProxyType({
+    'global': 1.0,
+    'north_america': 0.4,
+    'europe': 0.3,
+    'asia': 0.25,
+    'south_africa': 0.02
+})
+
+class GrowthProfile(NamedTuple):
+    """Annual growth rate and trend of an industry"""
+    rate: float
+    trend: str
+
+_GROWTH_RATES = MappingProxyType({
+    'technology': GrowthProfile(0.12, 'accelerating'),
+    'healthcare': GrowthProfile(0.08, 'stable'),
+    'finance': GrowthProfile(0.06, 'moderate'),
+    'retail': GrowthProfile(0.04, 'slowing')
+})
+
+_DEFAULT_GROWTH = GrowthProfile(0.05, 'stable')
+
+def _read_only_rows(*rows: Dict[str, Any]) -> tuple:
+    """Table rows as read-only mappings; results receive dict copies of them"""
+    return tuple(MappingProxyType(row) for row in rows)
+
+_KEY_PLAYERS = MappingProxyType({
+    'technology': _read_only_rows(
+        {'name': 'Tech Giant Inc.', 'position': 'market_leader', 'strengths': ('R&D', 'brand')},
+        {'name': 'Innovative Startups', 'position': 'challenger', 'strengths': ('agility', 'innovation')}
+    ),
+    'healthcare': _read_only_rows(
+        {'name': 'Medical Corp', 'position': 'established', 'strengths': ('distribution', 'reputation')},
+        {'name': 'HealthTech Solutions', 'position': 'emerging', 'strengths': ('technology', 'efficiency')}
+    )
+})
+
+_DEFAULT_KEY_PLAYERS = _read_only_rows(
+    {'name': 'Industry Leader', 'position': 'market_leader'},
+    {'name': 'Main Competitor', 'position': 'challenger'}
+)
+
+_COMMON_ENTRY_BARRIERS = _read_only_rows(
+    {
+        'type': 'capital',
+        'description': 'Initial investment required',
+        'severity': 'high',
+        'mitigation': 'Seek investors or bootstrap'
+    },
+    {
+        'type': 'regulatory',
+        'description': 'Industry regulations and compliance',
+        'severity': 'medium',
+        'mitigation': 'Hire legal expertise'
+    }
+)
+
+_INDUSTRY_ENTRY_BARRIERS = MappingProxyType({
+    'technology': _read_only_rows(
+        {
+            'type': 'technical',
+            'description': 'Specialized technical expertise required',
+            'severity': 'high',
+            'mitigation': 'Build strong technical team'
+        }
+    ),
+    'healthcare': _read_only_rows(
+        {
+            'type': 'certification',
+            'description': 'Medical certifications and approvals',
+            'severity': 'high',
+            'mitigation': 'Plan for regulatory approval process'
+        }
+    )
+})
+
+_MATURITY_LEVELS = MappingProxyType({
+    'technology': 'growth',
+    'healthcare': 'mature',
+    'finance': 'mature',
+    'retail': 'decline'
+})
+
+_COMPETITION_INTENSITY = MappingProxyType({
+    'technology': 'high',
+    'healthcare': 'medium',
+    'finance': 'high',
+    'retail': 'very_high'
+})
+
+_MARKET_DRIVERS = MappingProxyType({
+    'technology': (
+        'Digital transformation',
+        'AI and automation adoption',
+        'Remote work trends'
+    ),
+    'healthcare': (
+        'Aging population',
+        'Telemedicine adoption',
+        'Preventive healthcare focus'
+    )
+})
+
+_DEFAULT_MARKET_DRIVERS = (
+    'Economic growth',
+    'Technological advancement',
+    'Changing consumer preferences'
+)
+
+_MARKET_RESTRAINTS = MappingProxyType({
+    'technology': (
+        'Skill shortages',
+        'Rapid technological changes',
+        'Security concerns'
+    ),
+    'healthcare': (
+        'Regulatory complexity',
+        'High costs',
+        'Data privacy concerns'
+    )
+})
+
+_DEFAULT_MARKET_RESTRAINTS = (
+    'Economic uncertainty',
+    'Competitive pressure',
+    'Regulatory challenges'
+)
+
+_MARKET_OPPORTUNITIES = MappingProxyType({
+    'technology': (
+        'Edge computing',
+        'Quantum computing applications',
+        'Sustainable tech solutions'
+    ),
+    'healthcare': (
+        'Personalized medicine',
+        'Wearable health tech',
+        'AI-assisted diagnostics'
+    )
+})
+
+_DEFAULT_MARKET_OPPORTUNITIES = (
+    'Digital transformation',
+    'Emerging markets',
+    'Product innovation'
+)
+
+_GROWTH_FACTORS = MappingProxyType({
+    'technology': (
+        'Increasing digitalization',
+        'Cloud adoption',
+        'IoT expansion'
+    ),
+    'healthcare': (
+        'Healthcare spending increase',
+        'Medical technology advances',
+        'Preventive care focus'
+    )
+})
+
+_DEFAULT_GROWTH_FACTORS = (
+    'Economic development',
+    'Technological innovation',
+    'Market demand growth'
+)
+
+# Sections produced by _analyze_market when the task does not select any
+MARKET_SECTIONS = frozenset({'market_overview', 'competitive_landscape', 'market_dynamics', 'recommendations'})
+
+# Player count from which market shares are computed with the numeric kernel
+MARKET_SHARE_KERNEL_THRESHOLD = 64
+
+@lru_cache(maxsize=256)
+def _market_size_value(industry_key: str, geography_key: str) -> float:
+    """Estimated annual market size for a normalized industry/geography pair"""
+    base_size = _INDUSTRY_MULTIPLIERS.get(industry_key, 100000000)
+    geo_multiplier = _GEOGRAPHY_MULTIPLIERS.get(geography_key, 0.1)
+    return base_size * geo_multiplier
+
+@lru_cache(maxsize=256)
+def _market_size_rationale(value: float, currency: str) -> str:
+    return "Market size estimated at {:,.0f} {}".format(value, currency)
+
+@lru_cache(maxsize=256)
+def _growth_rate_rationale(rate: float) -> str:
+    return "High growth rate of {:.1%}".format(rate)
+
+@lru_cache(maxsize=256)
+def _entry_barriers(industry_key: str) -> tuple:
+    """Common plus industry specific entry barriers for a normalized industry"""
+    return _COMMON_ENTRY_BARRIERS + _INDUSTRY_ENTRY_BARRIERS.get(industry_key, ())
+
+# Memoized helpers reported by MarketAnalysisAgent.cache_stats
+_CACHED_HELPERS = (_market_size_value, _market_size_rationale, _growth_rate_rationale, _entry_barriers)
+
 class MarketAnalysisAgent(CollaborativeAgent):
     """AI agent specialized in market analysis and research"""
     
+    __slots__ = ()
+    
+    # Task type -> name of the coroutine method handling it
+    _TASK_HANDLERS = MappingProxyType({
+        'analyze_market': '_analyze_market',
+        'competitor_analysis': '_analyze_competitors',
+        'trend_analysis': '_analyze_trends',
+        'swot_analysis': '_perform_swot_analysis'
+    })
+    
     def __init__(self, agent_id: str = None):
         capabilities = [
             'market_research',
@@ -26,18 +249,21 @@ class MarketAnalysisAgent(CollaborativeAgent):
         
     async def process_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Process market analysis tasks"""
-        task_type = task.get('type', 'analyze_market')
+        handler_name = self._TASK_HANDLERS.get(task.get('type', 'analyze_market'), '_handle_unknown_task_type')
+        return await getattr(self, handler_name)(task)
+    
+    @staticmethod
+    def _normalize_sections(sections) -> frozenset:
+        """Requested sections as a frozenset; a single name may be given as a string"""
+        if isinstance(sections, str):
+            sections = (sections,)
+        sections = frozenset(sections)
         
-        if task_type == 'analyze_market':
-            return await self._analyze_market(task)
-        elif task_type == 'competitor_analysis':
-            return await self._analyze_competitors(task)
-        elif task_type == 'trend_analysis':
-            return await self._analyze_trends(task)
-        elif task_type == 'swot_analysis':
-            return await self._perform_swot_analysis(task)
-        else:
-            return await self._handle_unknown_task_type(task)
+        unknown = sections - MARKET_SECTIONS
+        if unknown:
+            raise ValueError(f"Unknown market analysis sections: {', '.join(sorted(unknown))}")
+        
+        return sections
     
     async def _analyze_market(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Comprehensive market analysis"""
@@ -45,270 +271,152 @@ class MarketAnalysisAgent(CollaborativeAgent):
         industry = market_definition.get('industry', '')
         geography = market_definition.get('geography', 'global')
         
-        market_size = await self._estimate_market_size(industry, geography)
-        growth_rate = await self._analyze_growth_trends(industry)
-        key_players = await self._identify_key_players(industry)
-        entry_barriers = await self._analyze_entry_barriers(industry)
+        # Normalize lookup keys once for all helpers
+        industry_key = industry.lower()
+        geography_key = geography.lower()
         
-        return {
-            'status': 'success',
-            'market_overview': {
+        # Callers may request a subset of sections to skip the others
+        sections = self._normalize_sections(task.get('sections', MARKET_SECTIONS))
+        needs_recommendations = 'recommendations' in sections
+        
+        result = {'status': 'success'}
+        
+        if 'market_overview' in sections or needs_recommendations:
+            market_size = self._estimate_market_size(industry_key, geography_key)
+            growth_rate = self._analyze_growth_trends(industry_key)
+        
+        if 'market_dynamics' in sections or needs_recommendations:
+            entry_barriers = self._analyze_entry_barriers(industry_key)
+        
+        if 'market_overview' in sections:
+            result['market_overview'] = {
                 'industry': industry,
                 'geography': geography,
                 'market_size': market_size,
                 'growth_rate': growth_rate,
-                'maturity': await self._assess_market_maturity(industry)
-            },
-            'competitive_landscape': {
-                'key_players': key_players,
-                'market_share_distribution': await self._estimate_market_share(key_players),
-                'competitive_intensity': await self._assess_competition_intensity(industry)
-            },
-            'market_dynamics': {
-                'drivers': await self._identify_market_drivers(industry),
-                'restraints': await self._identify_market_restraints(industry),
-                'opportunities': await self._identify_opportunities(industry),
-                'entry_barriers': entry_barriers
-            },
-            'recommendations': await self._generate_market_recommendations(market_size, growth_rate, entry_barriers)
-        }
-    
-    async def _estimate_market_size(self, industry: str, geography: str) -> Dict[str, Any]:
-        """Estimate market size for given industry and geography"""
-        # This would integrate with real data sources in production
-        industry_multipliers = {
-            'technology': 1000000000,
-            'healthcare': 500000000,
-            'finance': 750000000,
-            'retail': 300000000
-        }
+                'maturity': self._assess_market_maturity(industry_key)
+            }
         
-        geography_multipliers = {
-            'global': 1.0,
-            'north_america': 0.4,
-            'europe': 0.3,
-            'asia': 0.25,
-            'south_africa': 0.02
-        }
+        if 'competitive_landscape' in sections:
+            key_players = self._identify_key_players(industry_key)
+            result['competitive_landscape'] = {
+                'key_players': key_players,
+                'market_share_distribution': self._estimate_market_share(key_players),
+                'competitive_intensity': self._assess_competition_intensity(industry_key)
+            }
         
-        base_size = industry_multipliers.get(industry.lower(), 100000000)
-        geo_multiplier = geography_multipliers.get(geography.lower(), 0.1)
+        if 'market_dynamics' in sections:
+            result['market_dynamics'] = {
+                'drivers': self._identify_market_drivers(industry_key),
+                'restraints': self._identify_market_restraints(industry_key),
+                'opportunities': self._identify_opportunities(industry_key),
+                'entry_barriers': entry_barriers
+            }
         
-        estimated_size = base_size * geo_multiplier
+        if needs_recommendations:
+            result['recommendations'] = self._generate_market_recommendations(market_size, growth_rate, entry_barriers)
         
+        return result
+    
+    def _estimate_market_size(self, industry_key: str, geography_key: str) -> Dict[str, Any]:
+        """Estimate market size for given industry and geography"""
         return {
-            'value': estimated_size,
+            'value': _market_size_value(industry_key, geography_key),
             'currency': 'USD',
             'period': 'annual',
             'confidence': 'medium',
             'data_sources': ['industry_reports', 'market_research']
         }
     
-    async def _analyze_growth_trends(self, industry: str) -> Dict[str, Any]:
+    def _analyze_growth_trends(self, industry_key: str) -> Dict[str, Any]:
         """Analyze market growth trends"""
-        growth_rates = {
-            'technology': {'rate': 0.12, 'trend': 'accelerating'},
-            'healthcare': {'rate': 0.08, 'trend': 'stable'},
-            'finance': {'rate': 0.06, 'trend': 'moderate'},
-            'retail': {'rate': 0.04, 'trend': 'slowing'}
-        }
-        
-        default_growth = {'rate': 0.05, 'trend': 'stable'}
-        industry_growth = growth_rates.get(industry.lower(), default_growth)
+        growth = _GROWTH_RATES.get(industry_key, _DEFAULT_GROWTH)
         
         return {
-            'annual_growth_rate': industry_growth['rate'],
-            'trend': industry_growth['trend'],
+            'annual_growth_rate': growth.rate,
+            'trend': growth.trend,
             'projection_period': '5 years',
-            'key_growth_factors': await self._identify_growth_factors(industry)
+            'key_growth_factors': self._identify_growth_factors(industry_key)
         }
     
-    async def _identify_key_players(self, industry: str) -> List[Dict[str, Any]]:
+    def _identify_key_players(self, industry_key: str) -> List[Dict[str, Any]]:
         """Identify key players in the industry"""
-        player_templates = {
-            'technology': [
-                {'name': 'Tech Giant Inc.', 'position': 'market_leader', 'strengths': ['R&D', 'brand']},
-                {'name': 'Innovative Startups', 'position': 'challenger', 'strengths': ['agility', 'innovation']}
-            ],
-            'healthcare': [
-                {'name': 'Medical Corp', 'position': 'established', 'strengths': ['distribution', 'reputation']},
-                {'name': 'HealthTech Solutions', 'position': 'emerging', 'strengths': ['technology', 'efficiency']}
-            ]
-        }
-        
-        return player_templates.get(industry.lower(), [
-            {'name': 'Industry Leader', 'position': 'market_leader'},
-            {'name': 'Main Competitor', 'position': 'challenger'}
-        ])
+        return [dict(player) for player in _KEY_PLAYERS.get(industry_key, _DEFAULT_KEY_PLAYERS)]
     
-    async def _analyze_entry_barriers(self, industry: str) -> List[Dict[str, Any]]:
+    def _analyze_entry_barriers(self, industry_key: str) -> List[Dict[str, Any]]:
         """Analyze market entry barriers"""
-        common_barriers = [
-            {
-                'type': 'capital',
-                'description': 'Initial investment required',
-                'severity': 'high',
-                'mitigation': 'Seek investors or bootstrap'
-            },
-            {
-                'type': 'regulatory',
-                'description': 'Industry regulations and compliance',
-                'severity': 'medium',
-                'mitigation': 'Hire legal expertise'
-            }
-        ]
-        
-        industry_specific = {
-            'technology': [
-                {
-                    'type': 'technical',
-                    'description': 'Specialized technical expertise required',
-                    'severity': 'high',
-                    'mitigation': 'Build strong technical team'
-                }
-            ],
-            'healthcare': [
-                {
-                    'type': 'certification',
-                    'description': 'Medical certifications and approvals',
-                    'severity': 'high',
-                    'mitigation': 'Plan for regulatory approval process'
-                }
-            ]
-        }
-        
-        return common_barriers + industry_specific.get(industry.lower(), [])
+        return [dict(barrier) for barrier in _entry_barriers(industry_key)]
     
-    async def _assess_market_maturity(self, industry: str) -> str:
+    def _assess_market_maturity(self, industry_key: str) -> str:
         """Assess market maturity level"""
-        maturity_levels = {
-            'technology': 'growth',
-            'healthcare': 'mature',
-            'finance': 'mature',
-            'retail': 'decline'
-        }
-        
-        return maturity_levels.get(industry.lower(), 'emerging')
+        return _MATURITY_LEVELS.get(industry_key, 'emerging')
     
-    async def _estimate_market_share(self, key_players: List[Dict]) -> List[Dict[str, Any]]:
+    def _estimate_market_share(self, key_players: List[Dict]) -> List[Dict[str, Any]]:
         """Estimate market share distribution"""
         if not key_players:
             return []
             
-        shares = []
         total_players = len(key_players)
+        if total_players >= MARKET_SHARE_KERNEL_THRESHOLD:
+            return self._estimate_market_share_vectorized(key_players)
         
-        for i, player in enumerate(key_players):
-            # Simple distribution - leader gets 40%, others split the rest
-            if player.get('position') == 'market_leader':
-                share = 0.4
-            else:
-                share = (0.6) / (total_players - 1) if total_players > 1 else 0.6
-                
-            shares.append({
+        # Simple distribution - leader gets 40%, others split the rest
+        other_share = 0.6 / (total_players - 1) if total_players > 1 else 0.6
+        
+        return [
+            {
                 'player': player['name'],
-                'estimated_share': share,
+                'estimated_share': 0.4 if player.get('position') == MARKET_LEADER else other_share,
                 'position': player.get('position', 'unknown')
-            })
+            }
+            for player in key_players
+        ]
+    
+    def _estimate_market_share_vectorized(self, key_players: List[Dict]) -> List[Dict[str, Any]]:
+        """Estimate market share for large player sets with the compiled kernel"""
+        import numpy as np
+        try:
+            # Ahead-of-time compiled by scripts/build_kernels.py
+            from ._market_kernels import compute_shares
+        except ImportError:
+            from ._kernels import compute_shares
         
-        return shares
+        is_leader = np.fromiter(
+            (player.get('position') == MARKET_LEADER for player in key_players),
+            dtype=np.bool_,
+            count=len(key_players)
+        )
+        
+        return [
+            {
+                'player': player['name'],
+                'estimated_share': float(share),
+                'position': player.get('position', 'unknown')
+            }
+            for player, share in zip(key_players, compute_shares(is_leader))
+        ]
     
-    async def _assess_competition_intensity(self, industry: str) -> str:
+    def _assess_competition_intensity(self, industry_key: str) -> str:
         """Assess competition intensity"""
-        intensity_levels = {
-            'technology': 'high',
-            'healthcare': 'medium',
-            'finance': 'high',
-            'retail': 'very_high'
-        }
-        
-        return intensity_levels.get(industry.lower(), 'medium')
+        return _COMPETITION_INTENSITY.get(industry_key, 'medium')
     
-    async def _identify_market_drivers(self, industry: str) -> List[str]:
+    def _identify_market_drivers(self, industry_key: str) -> tuple:
         """Identify key market drivers"""
-        drivers = {
-            'technology': [
-                'Digital transformation',
-                'AI and automation adoption',
-                'Remote work trends'
-            ],
-            'healthcare': [
-                'Aging population',
-                'Telemedicine adoption',
-                'Preventive healthcare focus'
-            ]
-        }
-        
-        return drivers.get(industry.lower(), [
-            'Economic growth',
-            'Technological advancement',
-            'Changing consumer preferences'
-        ])
+        return _MARKET_DRIVERS.get(industry_key, _DEFAULT_MARKET_DRIVERS)
     
-    async def _identify_market_restraints(self, industry: str) -> List[str]:
+    def _identify_market_restraints(self, industry_key: str) -> tuple:
         """Identify market restraints"""
-        restraints = {
-            'technology': [
-                'Skill shortages',
-                'Rapid technological changes',
-                'Security concerns'
-            ],
-            'healthcare': [
-                'Regulatory complexity',
-                'High costs',
-                'Data privacy concerns'
-            ]
-        }
-        
-        return restraints.get(industry.lower(), [
-            'Economic uncertainty',
-            'Competitive pressure',
-            'Regulatory challenges'
-        ])
+        return _MARKET_RESTRAINTS.get(industry_key, _DEFAULT_MARKET_RESTRAINTS)
     
-    async def _identify_opportunities(self, industry: str) -> List[str]:
+    def _identify_opportunities(self, industry_key: str) -> tuple:
         """Identify market opportunities"""
-        opportunities = {
-            'technology': [
-                'Edge computing',
-                'Quantum computing applications',
-                'Sustainable tech solutions'
-            ],
-            'healthcare': [
-                'Personalized medicine',
-                'Wearable health tech',
-                'AI-assisted diagnostics'
-            ]
-        }
-        
-        return opportunities.get(industry.lower(), [
-            'Digital transformation',
-            'Emerging markets',
-            'Product innovation'
-        ])
+        return _MARKET_OPPORTUNITIES.get(industry_key, _DEFAULT_MARKET_OPPORTUNITIES)
     
-    async def _identify_growth_factors(self, industry: str) -> List[str]:
+    def _identify_growth_factors(self, industry_key: str) -> tuple:
         """Identify key growth factors"""
-        factors = {
-            'technology': [
-                'Increasing digitalization',
-                'Cloud adoption',
-                'IoT expansion'
-            ],
-            'healthcare': [
-                'Healthcare spending increase',
-                'Medical technology advances',
-                'Preventive care focus'
-            ]
-        }
-        
-        return factors.get(industry.lower(), [
-            'Economic development',
-            'Technological innovation',
-            'Market demand growth'
-        ])
+        return _GROWTH_FACTORS.get(industry_key, _DEFAULT_GROWTH_FACTORS)
     
-    async def _generate_market_recommendations(self, market_size: Dict, growth_rate: Dict, barriers: List[Dict]) -> List[Dict[str, Any]]:
+    def _generate_market_recommendations(self, market_size: Dict, growth_rate: Dict, barriers: List[Dict]) -> List[Dict[str, Any]]:
         """Generate market entry/expansion recommendations"""
         recommendations = []
         
@@ -318,7 +426,7 @@ class MarketAnalysisAgent(CollaborativeAgent):
                 'type': 'strategic',
                 'priority': 'high',
                 'recommendation': 'Consider market entry - large addressable market',
-                'rationale': f"Market size estimated at {market_size['value']:,.0f} {market_size['currency']}"
+                'rationale': _market_size_rationale(market_size['value'], market_size['currency'])
             })
         else:
             recommendations.append({
@@ -334,31 +442,37 @@ class MarketAnalysisAgent(CollaborativeAgent):
                 'type': 'timing',
                 'priority': 'high',
                 'recommendation': 'Act quickly to capture growth',
-                'rationale': f"High growth rate of {growth_rate['annual_growth_rate']:.1%}"
+                'rationale': _growth_rate_rationale(growth_rate['annual_growth_rate'])
             })
         
         # Barrier-based recommendations
-        high_barriers = [b for b in barriers if b['severity'] == 'high']
-        if high_barriers:
+        high_barrier_count = sum(1 for b in barriers if b['severity'] == SEVERITY_HIGH)
+        if high_barrier_count:
             recommendations.append({
                 'type': 'risk_mitigation',
                 'priority': 'high',
                 'recommendation': 'Develop barrier mitigation strategy',
-                'rationale': f"{len(high_barriers)} high-severity entry barriers identified"
+                'rationale': f"{high_barrier_count} high-severity entry barriers identified"
             })
         
         return recommendations
     
+    def cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss statistics of the memoized lookup helpers"""
+        stats = {helper.__name__: helper.cache_info()._asdict() for helper in _CACHED_HELPERS}
+        self.logger.debug("Cache stats: %s", stats)
+        return stats
+    
     async def learn_from_experience(self, experience: Dict[str, Any]):
         """Learn from market analysis experiences"""
         if 'market_overview' in experience:
             industry = experience['market_overview'].get('industry')
             if industry:
-                if 'industry_knowledge' not in self.memory:
-                    self.memory['industry_knowledge'] = {}
+                industry_knowledge = self.memory.get('industry_knowledge')
+                if industry_knowledge is None:
+                    industry_knowledge = self.memory['industry_knowledge'] = defaultdict(float)
                 
-                self.memory['industry_knowledge'][industry] = \
-                    self.memory['industry_knowledge'].get(industry, 0) + 0.1
+                industry_knowledge[industry] += 0.1
     
     async def _create_improvement_plan(self, area: str) -> Dict[str, Any]:
         """Create improvement plan for market analysis"""
@@ -385,25 +499,21 @@ class MarketAnalysisAgent(CollaborativeAgent):
     
     async def _merge_results(self, results: List[Dict]) -> Dict[str, Any]:
         """Merge multiple market analysis results"""
+        overviews = [result['market_overview'] for result in results if 'market_overview' in result]
+        
         merged_analysis = {
-            'combined_market_size': 0,
-            'average_growth_rate': 0,
-            'all_players': [],
-            'all_opportunities': []
+            'combined_market_size': sum(o.get('market_size', {}).get('value', 0) for o in overviews),
+            'average_growth_rate': sum(o.get('growth_rate', {}).get('annual_growth_rate', 0) for o in overviews),
+            'all_players': list(chain.from_iterable(
+                result['competitive_landscape'].get('key_players', [])
+                for result in results if 'competitive_landscape' in result
+            )),
+            'all_opportunities': list(chain.from_iterable(
+                result['market_dynamics'].get('opportunities', [])
+                for result in results if 'market_dynamics' in result
+            ))
         }
         
-        for result in results:
-            if 'market_overview' in result:
-                overview = result['market_overview']
-                merged_analysis['combined_market_size'] += overview.get('market_size', {}).get('value', 0)
-                merged_analysis['average_growth_rate'] += overview.get('growth_rate', {}).get('annual_growth_rate', 0)
-            
-            if 'competitive_landscape' in result:
-                merged_analysis['all_players'].extend(result['competitive_landscape'].get('key_players', []))
-            
-            if 'market_dynamics' in result:
-                merged_analysis['all_opportunities'].extend(result['market_dynamics'].get('opportunities', []))
-        
         # Calculate averages
         if results:
             merged_analysis['average_growth_rate'] /= len(results)
@@ -1,9 +1,63 @@
+import sys
+from collections import defaultdict
+from itertools import chain
+from types import MappingProxyType
 from typing import Dict, List, Any
 from ..base_agent import CollaborativeAgent
 
+# Interned values compared on every design
+PATTERN_MICROSERVICES = sys.intern('microservices')
+LANGUAGE_PYTHON = sys.intern('python')
+LANGUAGE_NODEJS = sys.intern('nodejs')
+
+# Frameworks and databases recommended per preferred language
+_STACK_TEMPLATES = MappingProxyType({
+    'python': MappingProxyType({'frameworks': ('fastapi', 'django'), 'databases': ('postgresql', 'mongodb')}),
+    'nodejs': MappingProxyType({'frameworks': ('express', 'nest.js'), 'databases': ('mongodb', 'postgresql')})
+})
+
+_EMPTY_STACK_TEMPLATE = MappingProxyType({'frameworks': (), 'databases': ()})
+
+_SCALING_STRATEGIES = MappingProxyType({
+    'small': ('vertical_scaling', 'basic_caching'),
+    'medium': ('horizontal_scaling', 'advanced_caching', 'load_balancing'),
+    'large': ('auto_scaling', 'microservices', 'distributed_caching', 'cdn')
+})
+
+_SCALING_MILESTONES = MappingProxyType({
+    'small': (
+        MappingProxyType({'users': 1000, 'action': 'Optimize database queries'}),
+        MappingProxyType({'users': 5000, 'action': 'Implement caching layer'})
+    ),
+    'medium': (
+        MappingProxyType({'users': 10000, 'action': 'Add load balancer'}),
+        MappingProxyType({'users': 50000, 'action': 'Implement microservices'})
+    ),
+    'large': (
+        MappingProxyType({'users': 100000, 'action': 'Implement auto-scaling'}),
+        MappingProxyType({'users': 500000, 'action': 'Global CDN deployment'})
+    )
+})
+
+# Infrastructure shared by every stack
+_STACK_DEFAULTS = MappingProxyType({
+    'messaging': 'rabbitmq',
+    'caching': 'redis',
+    'monitoring': 'prometheus'
+})
+
 class ArchitectureAgent(CollaborativeAgent):
     """AI agent specialized in software architecture and system design"""
     
+    __slots__ = ()
+    
+    # Task type -> name of the coroutine method handling it
+    _TASK_HANDLERS = MappingProxyType({
+        'design_system': '_design_system_architecture',
+        'evaluate_architecture': '_evaluate_architecture',
+        'migration_plan': '_create_migration_plan'
+    })
+    
     def __init__(self, agent_id: str = None):
         capabilities = [
             'system_design',
@@ -24,16 +78,8 @@ class ArchitectureAgent(CollaborativeAgent):
         
     async def process_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Process architecture design tasks"""
-        task_type = task.get('type', 'design_system')
-        
-        if task_type == 'design_system':
-            return await self._design_system_architecture(task)
-        elif task_type == 'evaluate_architecture':
-            return await self._evaluate_architecture(task)
-        elif task_type == 'migration_plan':
-            return await self._create_migration_plan(task)
-        else:
-            return await self._handle_unknown_task_type(task)
+        handler_name = self._TASK_HANDLERS.get(task.get('type', 'design_system'), '_handle_unknown_task_type')
+        return await getattr(self, handler_name)(task)
     
     async def _design_system_architecture(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Design system architecture based on requirements"""
@@ -42,16 +88,16 @@ class ArchitectureAgent(CollaborativeAgent):
         pattern_preference = requirements.get('pattern', 'microservices')
         
         architecture = await self._generate_architecture_design(requirements)
-        technology_stack = await self._select_technology_stack(architecture, requirements)
-        scalability_plan = await self._create_scalability_plan(architecture, scale_requirements)
+        
+        technology_stack = self._select_technology_stack(architecture, requirements)
         
         return {
             'status': 'success',
             'architecture_design': architecture,
             'technology_stack': technology_stack,
-            'scalability_plan': scalability_plan,
-            'risk_assessment': await self._assess_architecture_risks(architecture),
-            'cost_estimation': await self._estimate_costs(architecture, technology_stack)
+            'scalability_plan': self._create_scalability_plan(architecture, scale_requirements),
+            'risk_assessment': self._assess_architecture_risks(architecture),
+            'cost_estimation': self._estimate_costs(architecture, technology_stack)
         }
     
     async def _generate_architecture_design(self, requirements: Dict[str, Any]) -> Dict[str, Any]:
@@ -67,80 +113,46 @@ class ArchitectureAgent(CollaborativeAgent):
         
         # Generate component structure based on requirements
         if 'features' in requirements:
+            technology = LANGUAGE_PYTHON if requirements.get('preferred_language') == LANGUAGE_PYTHON else LANGUAGE_NODEJS
             for feature in requirements['features']:
                 design['components'].append({
                     'name': f"{feature}_service",
                     'responsibility': f"Handle {feature} functionality",
-                    'technology': 'python' if requirements.get('preferred_language') == 'python' else 'nodejs',
+                    'technology': technology,
                     'scaling_strategy': 'horizontal'
                 })
         
         return design
     
-    async def _select_technology_stack(self, architecture: Dict, requirements: Dict) -> Dict[str, Any]:
+    def _select_technology_stack(self, architecture: Dict, requirements: Dict) -> Dict[str, Any]:
         """Select appropriate technology stack"""
         preferred_language = requirements.get('preferred_language', 'python')
         
-        stack = {
+        return {
             'programming_language': preferred_language,
-            'frameworks': [],
-            'databases': [],
-            'messaging': 'rabbitmq',
-            'caching': 'redis',
-            'monitoring': 'prometheus'
+            **_STACK_TEMPLATES.get(preferred_language, _EMPTY_STACK_TEMPLATE),
+            **_STACK_DEFAULTS
         }
-        
-        if preferred_language == 'python':
-            stack['frameworks'] = ['fastapi', 'django']
-            stack['databases'] = ['postgresql', 'mongodb']
-        elif preferred_language == 'nodejs':
-            stack['frameworks'] = ['express', 'nest.js']
-            stack['databases'] = ['mongodb', 'postgresql']
-        
-        return stack
     
-    async def _create_scalability_plan(self, architecture: Dict, scale: str) -> Dict[str, Any]:
+    def _create_scalability_plan(self, architecture: Dict, scale: str) -> Dict[str, Any]:
         """Create scalability plan"""
-        scaling_strategies = {
-            'small': ['vertical_scaling', 'basic_caching'],
-            'medium': ['horizontal_scaling', 'advanced_caching', 'load_balancing'],
-            'large': ['auto_scaling', 'microservices', 'distributed_caching', 'cdn']
-        }
-        
         return {
             'target_scale': scale,
-            'strategies': scaling_strategies.get(scale, scaling_strategies['medium']),
-            'milestones': await self._define_scaling_milestones(scale),
+            'strategies': _SCALING_STRATEGIES.get(scale, _SCALING_STRATEGIES['medium']),
+            'milestones': self._define_scaling_milestones(scale),
             'monitoring_requirements': ['cpu_usage', 'memory_usage', 'response_time']
         }
     
-    async def _define_scaling_milestones(self, scale: str) -> List[Dict[str, Any]]:
+    def _define_scaling_milestones(self, scale: str) -> List[Dict[str, Any]]:
         """Define scaling milestones"""
-        milestones = []
-        
-        if scale == 'small':
-            milestones = [
-                {'users': 1000, 'action': 'Optimize database queries'},
-                {'users': 5000, 'action': 'Implement caching layer'}
-            ]
-        elif scale == 'medium':
-            milestones = [
-                {'users': 10000, 'action': 'Add load balancer'},
-                {'users': 50000, 'action': 'Implement microservices'}
-            ]
-        else:  # large
-            milestones = [
-                {'users': 100000, 'action': 'Implement auto-scaling'},
-                {'users': 500000, 'action': 'Global CDN deployment'}
-            ]
-        
-        return milestones
+        # Anything other than small/medium is planned as large; rows are copied so results own them
+        return [dict(row) for row in _SCALING_MILESTONES.get(scale, _SCALING_MILESTONES['large'])]
     
-    async def _assess_architecture_risks(self, architecture: Dict) -> Dict[str, Any]:
+    def _assess_architecture_risks(self, architecture: Dict) -> Dict[str, Any]:
         """Assess architecture risks"""
         risks = []
         
-        if architecture['pattern'] == 'microservices':
+        if architecture['pattern'] == PATTERN_MICROSERVICES:
             risks.append({
                 'risk': 'Distributed system complexity',
                 'severity': 'high',
@@ -160,7 +172,7 @@ class ArchitectureAgent(CollaborativeAgent):
             'recommendations': [r['mitigation'] for r in risks]
         }
     
-    async def _estimate_costs(self, architecture: Dict, tech_stack: Dict) -> Dict[str, Any]:
+    def _estimate_costs(self, architecture: Dict, tech_stack: Dict) -> Dict[str, Any]:
         """Estimate infrastructure costs"""
         component_count = len(architecture.get('components', []))
         
@@ -188,11 +200,12 @@ class ArchitectureAgent(CollaborativeAgent):
     async def learn_from_experience(self, experience: Dict[str, Any]):
         """Learn from architecture design experiences"""
         if 'architecture_design' in experience:
-            design_patterns = self.memory.get('successful_patterns', {})
+            design_patterns = self.memory.get('successful_patterns')
+            if design_patterns is None:
+                design_patterns = self.memory['successful_patterns'] = defaultdict(int)
             pattern = experience['architecture_design'].get('pattern')
             if pattern:
-                design_patterns[pattern] = design_patterns.get(pattern, 0) + 1
-            self.memory['successful_patterns'] = design_patterns
+                design_patterns[pattern] += 1
     
     async def _create_improvement_plan(self, area: str) -> Dict[str, Any]:
         """Create improvement plan for architecture design"""
@@ -219,17 +232,11 @@ class ArchitectureAgent(CollaborativeAgent):
     
     async def _merge_results(self, results: List[Dict]) -> Dict[str, Any]:
         """Merge multiple architecture design results"""
-        combined_design = {
-            'components': [],
-            'patterns_used': [],
-            'total_services': 0
-        }
+        designs = [result['architecture_design'] for result in results if 'architecture_design' in result]
+        components = list(chain.from_iterable(design.get('components', []) for design in designs))
         
-        for result in results:
-            if 'architecture_design' in result:
-                design = result['architecture_design']
-                combined_design['components'].extend(design.get('components', []))
-                combined_design['patterns_used'].append(design.get('pattern'))
-                combined_design['total_services'] += len(design.get('components', []))
-        
-        return combined_design
+        return {
+            'components': components,
+            'patterns_used': [design.get('pattern') for design in designs],
+            'total_services': len(components)
+        }
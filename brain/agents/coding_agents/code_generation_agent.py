@@ -1,12 +1,68 @@
-import os
 import ast
-import json
-from typing import Dict, List, Any
+import re
+import string
+from collections import defaultdict
+from io import StringIO
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Tuple
 from ..base_agent import CollaborativeAgent
 
+# Lines whose first non-blank character starts a '#' comment
+_COMMENT_LINE_RE = re.compile(r'^[^\S\n]*#', re.MULTILINE)
+
+# print( calls that start a line, with their indentation captured
+_PRINT_CALL_RE = re.compile(r'^([ \t]*)print\(', re.MULTILINE)
+
+# Skeletons returned by the simulated code generator
+_PYTHON_TEMPLATE = string.Template('''
+"""
+Generated Code for: ${functionality}
+Language: ${language}
+Constraints: ${constraints}
+"""
+
+${constraint_text}
+
+def main():
+    """Main functionality implementation"""
+    # TODO: Implement ${functionality}
+    print("Functionality: ${functionality}")
+    
+    # Example implementation
+    result = process_data()
+    return result
+
+def process_data():
+    """Process data according to requirements"""
+    # Implementation needed
+    return "processed_data"
+
+if __name__ == "__main__":
+    main()
+''')
+
+_GENERIC_TEMPLATE = string.Template('''
+// Generated Code for: ${functionality}
+// Language: ${language}
+// Constraints: ${constraints}
+
+${constraint_text}
+
+// TODO: Implement ${functionality} in ${language}
+
+''')
+
 class CodeGenerationAgent(CollaborativeAgent):
     """AI agent specialized in generating high-quality code"""
     
+    # Task type -> name of the coroutine method handling it
+    _TASK_HANDLERS = MappingProxyType({
+        'generate_code': '_generate_code',
+        'optimize_code': '_optimize_code',
+        'document_code': '_document_code',
+        'generate_tests': '_generate_tests'
+    })
+    
     def __init__(self, agent_id: str = None):
         capabilities = [
             'code_generation',
@@ -31,18 +87,8 @@ class CodeGenerationAgent(CollaborativeAgent):
         
     async def process_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Process code generation tasks"""
-        task_type = task.get('type', 'generate_code')
-        
-        if task_type == 'generate_code':
-            return await self._generate_code(task)
-        elif task_type == 'optimize_code':
-            return await self._optimize_code(task)
-        elif task_type == 'document_code':
-            return await self._document_code(task)
-        elif task_type == 'generate_tests':
-            return await self._generate_tests(task)
-        else:
-            return await self._handle_unknown_task_type(task)
+        handler_name = self._TASK_HANDLERS.get(task.get('type', 'generate_code'), '_handle_unknown_task_type')
+        return await getattr(self, handler_name)(task)
     
     async def _generate_code(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Generate code based on specifications"""
@@ -52,66 +98,39 @@ class CodeGenerationAgent(CollaborativeAgent):
         constraints = requirements.get('constraints', [])
         
         # Generate code using AI (simulated)
-        generated_code = await self._ai_generate_code(language, functionality, constraints)
+        generated_code = self._ai_generate_code(language, functionality, constraints)
         
         # Validate syntax
-        syntax_valid = await self._validate_syntax(generated_code, language)
+        syntax_valid, syntax_tree = self._validate_syntax(generated_code, language)
         
-        return {
+        result = {
             'status': 'success',
             'generated_code': generated_code,
             'language': language,
             'syntax_valid': syntax_valid,
-            'complexity_analysis': await self._analyze_complexity(generated_code),
-            'suggestions': await self._generate_improvement_suggestions(generated_code)
+            'complexity_analysis': self._analyze_complexity(generated_code),
+            'suggestions': self._generate_improvement_suggestions(generated_code)
         }
+        
+        # Opt-in, the tree is not JSON serializable; CodeReviewAgent accepts it as 'ast_tree'
+        if task.get('include_ast'):
+            result['ast_tree'] = syntax_tree
+        
+        return result
     
-    async def _ai_generate_code(self, language: str, functionality: str, constraints: List[str]) -> str:
+    def _ai_generate_code(self, language: str, functionality: str, constraints: List[str]) -> str:
         """Simulated AI code generation - would integrate with actual AI models"""
         # This is a simulation - in production, this would call OpenAI, Anthropic, etc.
         
-        constraint_text = "\n".join([f"# CONSTRAINT: {c}" for c in constraints])
+        constraint_text = "\n".join(f"# CONSTRAINT: {c}" for c in constraints)
+        code_template = _PYTHON_TEMPLATE if language == 'python' else _GENERIC_TEMPLATE
         
-        if language == 'python':
-            code_template = f'''
-"""
-Generated Code for: {functionality}
-Language: {language}
-Constraints: {constraints}
-"""
-
-{constraint_text}
-
-def main():
-    """Main functionality implementation"""
-    # TODO: Implement {functionality}
-    print("Functionality: {functionality}")
-    
-    # Example implementation
-    result = process_data()
-    return result
-
-def process_data():
-    """Process data according to requirements"""
-    # Implementation needed
-    return "processed_data"
-
-if __name__ == "__main__":
-    main()
-'''
-        else:
-            code_template = f'''
-// Generated Code for: {functionality}
-// Language: {language}
-// Constraints: {constraints}
-
-{constraint_text}
-
-// TODO: Implement {functionality} in {language}
-
-'''
-        
-        return code_template.strip()
+        return code_template.substitute(
+            functionality=functionality,
+            language=language,
+            constraints=constraints,
+            constraint_text=constraint_text
+        ).strip()
     
     async def _optimize_code(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Optimize existing code"""
@@ -119,30 +138,38 @@ if __name__ == "__main__":
         optimization_goal = task.get('optimization_goal', 'performance')
         
         optimized_code = await self._ai_optimize_code(code, optimization_goal)
-        improvement_metrics = await self._calculate_improvement(code, optimized_code, optimization_goal)
+        improvement_metrics = self._calculate_improvement(code, optimized_code, optimization_goal)
         
         return {
             'status': 'success',
             'original_code': code,
             'optimized_code': optimized_code,
             'improvement_metrics': improvement_metrics,
-            'optimization_notes': await self._generate_optimization_notes(code, optimized_code)
+            'optimization_notes': self._generate_optimization_notes(code, optimized_code)
         }
     
     async def learn_from_experience(self, experience: Dict[str, Any]):
         """Learn from code generation experiences"""
-        if experience.get('status') == 'success':
-            successful_patterns = experience.get('successful_patterns', {})
-            self.memory['successful_patterns'] = self.memory.get('successful_patterns', {})
-            self.memory['successful_patterns'].update(successful_patterns)
-            
-        # Update language-specific knowledge
-        language = experience.get('language')
-        if language:
-            if 'language_proficiency' not in self.memory:
-                self.memory['language_proficiency'] = {}
-            self.memory['language_proficiency'][language] = \
-                self.memory['language_proficiency'].get(language, 0) + 0.1
+        await self.learn_from_experiences((experience,))
+    
+    async def learn_from_experiences(self, experiences: List[Dict[str, Any]]):
+        """Learn from a batch of code generation experiences"""
+        memory = self.memory
+        successful_patterns = memory.get('successful_patterns')
+        language_proficiency = memory.get('language_proficiency')
+        
+        for experience in experiences:
+            if experience.get('status') == 'success':
+                if successful_patterns is None:
+                    successful_patterns = memory['successful_patterns'] = {}
+                successful_patterns.update(experience.get('successful_patterns', {}))
+                
+            # Update language-specific knowledge
+            language = experience.get('language')
+            if language:
+                if language_proficiency is None:
+                    language_proficiency = memory['language_proficiency'] = defaultdict(float)
+                language_proficiency[language] += 0.1
     
     async def _create_improvement_plan(self, area: str) -> Dict[str, Any]:
         """Create improvement plan for specific area"""
@@ -178,28 +205,30 @@ if __name__ == "__main__":
             'expected_impact': '10-20% performance improvement'
         }
     
-    async def _validate_syntax(self, code: str, language: str) -> bool:
-        """Validate code syntax"""
-        try:
-            if language == 'python':
-                ast.parse(code)
-                return True
+    def _validate_syntax(self, code: str, language: str) -> Tuple[bool, Optional[ast.AST]]:
+        """Validate code syntax, returning the parsed tree for Python code"""
+        if language != 'python':
             # Add other language validators as needed
-            return True  # Default to true for other languages for now
-        except:
-            return False
+            return True, None  # Default to true for other languages for now
+        
+        try:
+            return True, ast.parse(code)
+        except (SyntaxError, ValueError):
+            # ValueError is raised for source containing null bytes
+            return False, None
     
-    async def _analyze_complexity(self, code: str) -> Dict[str, Any]:
+    def _analyze_complexity(self, code: str) -> Dict[str, Any]:
         """Analyze code complexity"""
-        lines = code.split('\n')
+        line_count = code.count('\n') + 1
+        comment_lines = sum(1 for _ in _COMMENT_LINE_RE.finditer(code))
         return {
-            'line_count': len(lines),
+            'line_count': line_count,
             'function_count': code.count('def '),
             'class_count': code.count('class '),
-            'comment_density': len([l for l in lines if l.strip().startswith('#')]) / len(lines) if lines else 0
+            'comment_density': comment_lines / line_count
         }
     
-    async def _generate_improvement_suggestions(self, code: str) -> List[str]:
+    def _generate_improvement_suggestions(self, code: str) -> List[str]:
         """Generate suggestions for code improvement"""
         suggestions = []
         
@@ -217,18 +246,18 @@ if __name__ == "__main__":
     async def _ai_optimize_code(self, code: str, goal: str) -> str:
         """Simulated AI code optimization"""
         # In production, this would use actual AI models
-        optimized = code.replace('print(', '# print(') if goal == 'performance' else code
+        optimized = _PRINT_CALL_RE.sub(r'\1# print(', code) if goal == 'performance' else code
         return optimized + "\n# Optimized for: " + goal
     
-    async def _calculate_improvement(self, original: str, optimized: str, goal: str) -> Dict[str, Any]:
+    def _calculate_improvement(self, original: str, optimized: str, goal: str) -> Dict[str, Any]:
         """Calculate improvement metrics"""
         return {
-            'lines_reduced': len(optimized.split('\n')) - len(original.split('\n')),
+            'lines_reduced': optimized.count('\n') - original.count('\n'),
             'goal_achievement': 'partial',
             'estimated_performance_gain': '15%'
         }
     
-    async def _generate_optimization_notes(self, original: str, optimized: str) -> List[str]:
+    def _generate_optimization_notes(self, original: str, optimized: str) -> List[str]:
         """Generate notes about optimizations performed"""
         return [
             "Removed debug print statements",
@@ -238,10 +267,17 @@ if __name__ == "__main__":
     
     async def _merge_results(self, results: List[Dict]) -> Dict[str, Any]:
         """Merge multiple code generation results"""
-        merged_code = "\n\n".join([r.get('generated_code', '') for r in results])
+        # Single pass: stream the code and accumulate line counts together
+        buffer = StringIO()
+        combined_complexity = 0
+        for index, r in enumerate(results):
+            if index:
+                buffer.write("\n\n")
+            buffer.write(r.get('generated_code', ''))
+            combined_complexity += r.get('complexity_analysis', {}).get('line_count', 0)
         
         return {
-            'merged_code': merged_code,
+            'merged_code': buffer.getvalue(),
             'component_count': len(results),
-            'combined_complexity': sum(r.get('complexity_analysis', {}).get('line_count', 0) for r in results)
+            'combined_complexity': combined_complexity
         }
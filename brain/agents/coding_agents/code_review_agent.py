@@ -1,7 +1,163 @@
 import ast
-from typing import Dict, List, Any
+import os
+import re
+import sys
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from types import MappingProxyType
+from typing import Dict, List, Any, NamedTuple, Optional
 from ..base_agent import BaseAgent
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Interned severities and issue types used as Counter / dict keys
+SEVERITY_CRITICAL = sys.intern('critical')
+SEVERITY_HIGH = sys.intern('high')
+SEVERITY_MEDIUM = sys.intern('medium')
+SEVERITY_LOW = sys.intern('low')
+
+ISSUE_SYNTAX_ERROR = sys.intern('syntax_error')
+ISSUE_SECURITY = sys.intern('security')
+ISSUE_PERFORMANCE = sys.intern('performance')
+ISSUE_MAINTAINABILITY = sys.intern('maintainability')
+ISSUE_BEST_PRACTICE = sys.intern('best_practice')
+
+# Severity levels, most severe first, and their weight in the quality score
+SEVERITIES = (SEVERITY_CRITICAL, SEVERITY_HIGH, SEVERITY_MEDIUM, SEVERITY_LOW)
+SEVERITY_WEIGHTS = MappingProxyType({SEVERITY_CRITICAL: 10, SEVERITY_HIGH: 5, SEVERITY_MEDIUM: 2, SEVERITY_LOW: 1})
+
+# Focus areas checked when a review asks for 'all'
+REVIEW_AREAS = frozenset({'security', 'performance', 'maintainability', 'best_practices'})
+
+# (severity, weight) pairs walked by the quality score, and the score
+# denominator contributed by each issue
+_WEIGHTED_SEVERITIES = tuple(SEVERITY_WEIGHTS.items())
+_MAX_ISSUE_WEIGHT = sum(SEVERITY_WEIGHTS.values())
+
+# Quality score thresholds and the assessment for each band between them
+_ASSESSMENT_THRESHOLDS = (60, 75, 90)
+_ASSESSMENTS = (
+    "Poor code quality, significant refactoring recommended",
+    "Fair code quality, several improvements needed",
+    "Good code quality with some areas for improvement",
+    "Excellent code quality with minor improvements possible"
+)
+
+class Issue(NamedTuple):
+    """A single review finding; optional fields left as None are omitted from the report"""
+    type: str
+    severity: str
+    message: str
+    suggestion: str
+    line: Optional[int] = None
+    pattern: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict form used in review results"""
+        return {field: value for field, value in zip(self._fields, self) if value is not None}
+
+# Security signatures: matched call -> (severity, message)
+_SECURITY_PATTERNS = MappingProxyType({
+    'eval(': (SEVERITY_CRITICAL, 'Use of eval is dangerous'),
+    'exec(': (SEVERITY_CRITICAL, 'Use of exec is dangerous'),
+    'pickle.loads(': (SEVERITY_HIGH, 'Unpickling untrusted data is dangerous'),
+    'subprocess.call(': (SEVERITY_MEDIUM, 'Validate all subprocess inputs'),
+    'os.system(': (SEVERITY_HIGH, 'Use subprocess with validated inputs instead')
+})
+
+# All security signatures scanned in a single pass: an Aho-Corasick automaton
+# when pyahocorasick is installed, otherwise a regex alternation
+_SECURITY_RE = re.compile(r'\b(' + '|'.join(map(re.escape, _SECURITY_PATTERNS)) + ')')
+
+if ahocorasick is not None:
+    _SECURITY_AUTOMATON = ahocorasick.Automaton()
+    for _pattern in _SECURITY_PATTERNS:
+        _SECURITY_AUTOMATON.add_word(_pattern, _pattern)
+    _SECURITY_AUTOMATON.make_automaton()
+    del _pattern
+else:
+    _SECURITY_AUTOMATON = None
+
+_NEWLINE_RE = re.compile('\n')
+
+def _build_line_index(code: str) -> List[int]:
+    """Sorted offsets of every newline in code, for bisecting match offsets to line numbers"""
+    return [match.start() for match in _NEWLINE_RE.finditer(code)]
+
+def _iter_security_matches(code: str):
+    """Yield (start offset, signature) for each security signature found in code"""
+    if _SECURITY_AUTOMATON is None:
+        for match in _SECURITY_RE.finditer(code):
+            yield match.start(), match.group(1)
+        return
+    
+    for end_index, pattern in _SECURITY_AUTOMATON.iter(code):
+        start = end_index - len(pattern) + 1
+        # Same word boundary as the regex, so e.g. literal_eval( is not reported as eval(
+        if start and (code[start - 1].isalnum() or code[start - 1] == '_'):
+            continue
+        yield start, pattern
+
+class _StructuralStats:
+    """Structural facts about a parsed module, gathered in a single traversal"""
+    
+    __slots__ = (
+        'max_loop_depth', 'has_string_concat_in_loop', 'has_bare_except',
+        'has_wildcard_import', 'magic_numbers'
+    )
+    
+    def __init__(self, tree: ast.AST):
+        self.max_loop_depth = 0
+        self.has_string_concat_in_loop = False
+        self.has_bare_except = False
+        self.has_wildcard_import = False
+        self.magic_numbers = []
+        self._collect(tree)
+        
+    def _collect(self, tree: ast.AST):
+        """Iterative pre-order walk tracking the syntactic loop depth of every node"""
+        stack = [(tree, 0)]
+        
+        while stack:
+            node, loop_depth = stack.pop()
+            
+            if isinstance(node, (ast.For, ast.AsyncFor)):
+                loop_depth += 1
+                if loop_depth > self.max_loop_depth:
+                    self.max_loop_depth = loop_depth
+            elif isinstance(node, ast.Constant):
+                # Numbers with 2+ digits
+                value = node.value
+                if isinstance(value, (int, float)) and not isinstance(value, bool) and abs(value) >= 10:
+                    self.magic_numbers.append(str(value))
+                continue
+            elif isinstance(node, ast.AugAssign):
+                if loop_depth and isinstance(node.op, ast.Add) and self._is_string_expr(node.value):
+                    self.has_string_concat_in_loop = True
+            elif isinstance(node, ast.ExceptHandler):
+                if node.type is None:
+                    self.has_bare_except = True
+            elif isinstance(node, ast.ImportFrom):
+                if any(alias.name == '*' for alias in node.names):
+                    self.has_wildcard_import = True
+                continue
+            
+            # Reversed so children are popped in source order
+            children = list(ast.iter_child_nodes(node))
+            children.reverse()
+            stack.extend((child, loop_depth) for child in children)
+            
+    @staticmethod
+    def _is_string_expr(node: ast.AST) -> bool:
+        if isinstance(node, ast.Constant):
+            return isinstance(node.value, str)
+        if isinstance(node, ast.JoinedStr):
+            return True
+        return isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == 'str'
+
 class CodeReviewAgent(BaseAgent):
     """AI agent specialized in code review and quality assurance"""
     
@@ -28,206 +184,203 @@ class CodeReviewAgent(BaseAgent):
         code = task.get('code', '')
         review_focus = task.get('review_focus', ['all'])
         
-        issues = await self._analyze_code(code, review_focus)
-        quality_score = await self._calculate_quality_score(issues)
-        recommendations = await self._generate_recommendations(issues)
+        # Reuse a tree already parsed upstream (e.g. by CodeGenerationAgent)
+        issues = self._analyze_code(code, review_focus, task.get('ast_tree'))
+        severity_counts = Counter(issue.severity for issue in issues)
+        type_counts = Counter(issue.type for issue in issues)
+        
+        quality_score = self._calculate_quality_score(severity_counts, len(issues))
+        recommendations = self._generate_recommendations(severity_counts, type_counts)
         
         return {
             'status': 'success',
             'quality_score': quality_score,
             'issues_found': len(issues),
-            'issues_by_severity': self._categorize_issues_by_severity(issues),
-            'detailed_issues': issues,
+            'issues_by_severity': self._categorize_issues_by_severity(severity_counts),
+            'detailed_issues': [issue.to_dict() for issue in issues],
             'recommendations': recommendations,
-            'overall_assessment': await self._generate_assessment(quality_score, issues)
+            'overall_assessment': self._generate_assessment(quality_score, issues)
         }
     
-    async def _analyze_code(self, code: str, focus_areas: List[str]) -> List[Dict[str, Any]]:
+    async def review_batch(self, tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Review many files in parallel worker processes, one per CPU core"""
+        if not tasks:
+            return []
+        
+        return await self.execute_batch(tasks, max_workers=os.cpu_count() or 1)
+    
+    def _analyze_code(self, code: str, focus_areas: List[str], tree: Optional[ast.AST] = None) -> List[Issue]:
         """Analyze code for issues"""
         issues = []
+        areas = frozenset(focus_areas)
+        if 'all' in areas:
+            areas = REVIEW_AREAS
         
         try:
             # Parse code for structural analysis
-            tree = ast.parse(code)
+            if tree is None:
+                tree = ast.parse(code)
+            stats = _StructuralStats(tree)
             
             # Check for various issue types
-            if 'security' in focus_areas or 'all' in focus_areas:
-                issues.extend(await self._check_security_issues(code, tree))
+            if 'security' in areas:
+                issues.extend(self._check_security_issues(code, tree))
                 
-            if 'performance' in focus_areas or 'all' in focus_areas:
-                issues.extend(await self._check_performance_issues(code, tree))
+            if 'performance' in areas:
+                issues.extend(self._check_performance_issues(stats))
                 
-            if 'maintainability' in focus_areas or 'all' in focus_areas:
-                issues.extend(await self._check_maintainability_issues(code, tree))
+            if 'maintainability' in areas:
+                issues.extend(self._check_maintainability_issues(code, stats))
                 
-            if 'best_practices' in focus_areas or 'all' in focus_areas:
-                issues.extend(await self._check_best_practices(code, tree))
+            if 'best_practices' in areas:
+                issues.extend(self._check_best_practices(stats))
                 
         except SyntaxError as e:
-            issues.append({
-                'type': 'syntax_error',
-                'severity': 'critical',
-                'message': f'Syntax error: {str(e)}',
-                'line': getattr(e, 'lineno', 'unknown'),
-                'suggestion': 'Fix syntax error before proceeding with review'
-            })
+            issues.append(Issue(
+                type=ISSUE_SYNTAX_ERROR,
+                severity=SEVERITY_CRITICAL,
+                message=f'Syntax error: {str(e)}',
+                line=getattr(e, 'lineno', 'unknown'),
+                suggestion='Fix syntax error before proceeding with review'
+            ))
         
         return issues
     
-    async def _check_security_issues(self, code: str, tree: ast.AST) -> List[Dict[str, Any]]:
+    def _check_security_issues(self, code: str, tree: ast.AST) -> List[Issue]:
         """Check for security issues"""
         issues = []
-        security_patterns = [
-            ('eval(', 'critical', 'Use of eval is dangerous'),
-            ('exec(', 'critical', 'Use of exec is dangerous'),
-            ('pickle.loads(', 'high', 'Unpickling untrusted data is dangerous'),
-            ('subprocess.call(', 'medium', 'Validate all subprocess inputs'),
-            ('os.system(', 'high', 'Use subprocess with validated inputs instead')
-        ]
+        line_index = None
         
-        for pattern, severity, message in security_patterns:
-            if pattern in code:
-                issues.append({
-                    'type': 'security',
-                    'severity': severity,
-                    'message': message,
-                    'pattern': pattern,
-                    'suggestion': 'Use safer alternatives and validate inputs'
-                })
+        for start, pattern in _iter_security_matches(code):
+            if line_index is None:
+                # Only index lines once there is something to locate
+                line_index = _build_line_index(code)
+            severity, message = _SECURITY_PATTERNS[pattern]
+            issues.append(Issue(
+                type=ISSUE_SECURITY,
+                severity=severity,
+                message=message,
+                pattern=pattern,
+                line=bisect_left(line_index, start) + 1,
+                suggestion='Use safer alternatives and validate inputs'
+            ))
         
         return issues
     
-    async def _check_performance_issues(self, code: str, tree: ast.AST) -> List[Dict[str, Any]]:
+    def _check_performance_issues(self, stats: _StructuralStats) -> List[Issue]:
         """Check for performance issues"""
         issues = []
         
         # Check for nested loops
-        if code.count('for ') > 2 and code.count('for ') == code.count('    for '):
-            issues.append({
-                'type': 'performance',
-                'severity': 'medium',
-                'message': 'Potential nested loops detected',
-                'suggestion': 'Consider using more efficient algorithms or vectorization'
-            })
+        if stats.max_loop_depth > 1:
+            issues.append(Issue(
+                type=ISSUE_PERFORMANCE,
+                severity=SEVERITY_MEDIUM,
+                message='Potential nested loops detected',
+                suggestion='Consider using more efficient algorithms or vectorization'
+            ))
         
         # Check for string concatenation in loops
-        if 'for ' in code and '+=' in code and 'str' in code:
-            issues.append({
-                'type': 'performance',
-                'severity': 'low',
-                'message': 'String concatenation in loop',
-                'suggestion': 'Use join() for better performance with large datasets'
-            })
+        if stats.has_string_concat_in_loop:
+            issues.append(Issue(
+                type=ISSUE_PERFORMANCE,
+                severity=SEVERITY_LOW,
+                message='String concatenation in loop',
+                suggestion='Use join() for better performance with large datasets'
+            ))
         
         return issues
     
-    async def _check_maintainability_issues(self, code: str, tree: ast.AST) -> List[Dict[str, Any]]:
+    def _check_maintainability_issues(self, code: str, stats: _StructuralStats) -> List[Issue]:
         """Check for maintainability issues"""
         issues = []
-        lines = code.split('\n')
         
         # Check function length
-        if len(lines) > 50:
-            issues.append({
-                'type': 'maintainability',
-                'severity': 'medium',
-                'message': 'Long function detected',
-                'suggestion': 'Break into smaller, focused functions'
-            })
+        if code.count('\n') + 1 > 50:
+            issues.append(Issue(
+                type=ISSUE_MAINTAINABILITY,
+                severity=SEVERITY_MEDIUM,
+                message='Long function detected',
+                suggestion='Break into smaller, focused functions'
+            ))
         
         # Check for magic numbers
-        import re
-        magic_numbers = re.findall(r'\b\d{2,}\b', code)  # Numbers with 2+ digits
+        magic_numbers = stats.magic_numbers
         if magic_numbers:
-            issues.append({
-                'type': 'maintainability',
-                'severity': 'low',
-                'message': f'Magic numbers found: {magic_numbers}',
-                'suggestion': 'Define numbers as named constants'
-            })
+            issues.append(Issue(
+                type=ISSUE_MAINTAINABILITY,
+                severity=SEVERITY_LOW,
+                message=f'Magic numbers found: {magic_numbers}',
+                suggestion='Define numbers as named constants'
+            ))
         
         return issues
     
-    async def _check_best_practices(self, code: str, tree: ast.AST) -> List[Dict[str, Any]]:
+    def _check_best_practices(self, stats: _StructuralStats) -> List[Issue]:
         """Check for coding best practices"""
         issues = []
         
         # Check for proper exception handling
-        if 'try:' in code and 'except:' in code and 'except Exception:' not in code:
-            issues.append({
-                'type': 'best_practice',
-                'severity': 'medium',
-                'message': 'Bare except clause',
-                'suggestion': 'Specify exception types to catch'
-            })
+        if stats.has_bare_except:
+            issues.append(Issue(
+                type=ISSUE_BEST_PRACTICE,
+                severity=SEVERITY_MEDIUM,
+                message='Bare except clause',
+                suggestion='Specify exception types to catch'
+            ))
         
         # Check for proper imports
-        if 'from module import *' in code:
-            issues.append({
-                'type': 'best_practice',
-                'severity': 'low',
-                'message': 'Wildcard import',
-                'suggestion': 'Import specific functions/classes'
-            })
+        if stats.has_wildcard_import:
+            issues.append(Issue(
+                type=ISSUE_BEST_PRACTICE,
+                severity=SEVERITY_LOW,
+                message='Wildcard import',
+                suggestion='Import specific functions/classes'
+            ))
         
         return issues
     
-    async def _calculate_quality_score(self, issues: List[Dict]) -> float:
+    def _calculate_quality_score(self, severity_counts: Counter, issue_count: int) -> float:
         """Calculate overall code quality score"""
-        if not issues:
+        if not issue_count:
             return 100.0
         
-        severity_weights = {'critical': 10, 'high': 5, 'medium': 2, 'low': 1}
-        total_weight = sum(severity_weights.values()) * len(issues)  # Max possible
+        total_weight = _MAX_ISSUE_WEIGHT * issue_count  # Max possible
         
-        actual_weight = sum(severity_weights[issue['severity']] for issue in issues)
+        actual_weight = sum(weight * severity_counts[severity] for severity, weight in _WEIGHTED_SEVERITIES)
         
         # Convert to percentage (higher is better)
-        score = max(0, 100 - (actual_weight / total_weight * 100)) if total_weight > 0 else 100
+        score = max(0, 100 - (actual_weight / total_weight * 100))
         return round(score, 2)
     
-    def _categorize_issues_by_severity(self, issues: List[Dict]) -> Dict[str, int]:
+    def _categorize_issues_by_severity(self, severity_counts: Counter) -> Dict[str, int]:
         """Categorize issues by severity level"""
-        categories = {'critical': 0, 'high': 0, 'medium': 0, 'low': 0}
-        
-        for issue in issues:
-            categories[issue['severity']] += 1
-            
-        return categories
+        return {severity: severity_counts[severity] for severity in SEVERITIES}
     
-    async def _generate_recommendations(self, issues: List[Dict]) -> List[str]:
+    def _generate_recommendations(self, severity_counts: Counter, type_counts: Counter) -> List[str]:
         """Generate overall recommendations"""
         recommendations = []
         
-        critical_count = len([i for i in issues if i['severity'] == 'critical'])
+        critical_count = severity_counts[SEVERITY_CRITICAL]
         if critical_count > 0:
             recommendations.append(f"Address {critical_count} critical issues immediately")
         
-        high_count = len([i for i in issues if i['severity'] == 'high'])
+        high_count = severity_counts[SEVERITY_HIGH]
         if high_count > 0:
             recommendations.append(f"Fix {high_count} high-priority issues soon")
         
         # Add specific recommendations based on issue types
-        security_issues = [i for i in issues if i['type'] == 'security']
-        if security_issues:
+        if type_counts[ISSUE_SECURITY]:
             recommendations.append("Perform security review and testing")
         
-        performance_issues = [i for i in issues if i['type'] == 'performance']
-        if performance_issues:
+        if type_counts[ISSUE_PERFORMANCE]:
             recommendations.append("Conduct performance testing")
         
         return recommendations
     
-    async def _generate_assessment(self, quality_score: float, issues: List[Dict]) -> str:
+    def _generate_assessment(self, quality_score: float, issues: List[Dict]) -> str:
         """Generate overall assessment text"""
-        if quality_score >= 90:
-            return "Excellent code quality with minor improvements possible"
-        elif quality_score >= 75:
-            return "Good code quality with some areas for improvement"
-        elif quality_score >= 60:
-            return "Fair code quality, several improvements needed"
-        else:
-            return "Poor code quality, significant refactoring recommended"
+        return _ASSESSMENTS[bisect_right(_ASSESSMENT_THRESHOLDS, quality_score)]
     
     async def learn_from_experience(self, experience: Dict[str, Any]):
         """Learn from code review experiences"""
@@ -1,37 +1,155 @@
+import re
+import sys
 import traceback
+from collections import OrderedDict
+from types import MappingProxyType
 from typing import Dict, List, Any
 from ..base_agent import BaseAgent
 
+# Maximum number of distinct errors whose analysis is memoized per agent
+ANALYSIS_CACHE_SIZE = 512
+
+# Maximum number of error types with learned patterns; least recently seen are evicted
+MAX_ERROR_PATTERN_TYPES = 500
+
+# (message keyword, error category), in category precedence order
+_CATEGORY_KEYWORDS = (
+    ('syntax', 'syntax'),
+    ('memory', 'resource'),
+    ('stack', 'resource'),
+    ('timeout', 'performance'),
+    ('performance', 'performance'),
+    ('import', 'dependency'),
+    ('module', 'dependency')
+)
+
+# Message indicators of critical / high severity errors, each set matched with one regex
+_CRITICAL_INDICATORS = frozenset({'memory', 'segmentation', 'core dumped', 'data loss'})
+_HIGH_INDICATORS = frozenset({'timeout', 'performance', 'database connection'})
+
+_CRITICAL_INDICATOR_RE = re.compile('|'.join(map(re.escape, sorted(_CRITICAL_INDICATORS))))
+_HIGH_INDICATOR_RE = re.compile('|'.join(map(re.escape, sorted(_HIGH_INDICATORS))))
+
+# (primary cause fragment, proposed fix) rules applied by _generate_fixes
+_FIX_RULES = (
+    ('Uninitialized variable', MappingProxyType({
+        'type': 'code_fix',
+        'description': 'Add null check before accessing variable',
+        'code_example': 'if variable is not None:\n    # use variable',
+        'risk': 'low',
+        'effort': 'low'
+    })),
+    ('Array/list access beyond bounds', MappingProxyType({
+        'type': 'code_fix',
+        'description': 'Add bounds checking before array access',
+        'code_example': 'if index < len(array):\n    value = array[index]',
+        'risk': 'low',
+        'effort': 'low'
+    })),
+    ('Missing dependency', MappingProxyType({
+        'type': 'dependency_fix',
+        'description': 'Install missing package',
+        'command': 'pip install missing-package',
+        'risk': 'low',
+        'effort': 'low'
+    }))
+)
+
+# Immediate prevention actions per error category
+_PREVENTION_STRATEGIES = MappingProxyType({
+    'syntax': ('Use linters', 'Enable IDE syntax checking', 'Code review'),
+    'resource': ('Add resource monitoring', 'Implement cleanup handlers', 'Use context managers'),
+    'performance': ('Add performance tests', 'Monitor resource usage', 'Implement caching'),
+    'dependency': ('Use dependency management', 'Pin versions', 'Regular updates'),
+    'logical': ('Add unit tests', 'Code review', 'Static analysis')
+})
+
+_DEFAULT_PREVENTION_STRATEGY = ('Code review', 'Add tests')
+
+_LONG_TERM_STRATEGIES = (
+    'Implement comprehensive testing',
+    'Add monitoring and alerting',
+    'Regular code quality assessments'
+)
+
+_RECOMMENDED_TOOLS = ('pylint', 'pytest', 'logging', 'monitoring_dashboard')
+
+# Debugging steps suggested for every error, extended per error category
+_BASE_DEBUGGING_STEPS = (
+    "Reproduce the error consistently",
+    "Check recent code changes",
+    "Examine logs for additional context"
+)
+
+_DEBUGGING_STEPS = MappingProxyType({
+    'performance': _BASE_DEBUGGING_STEPS + (
+        "Profile code performance",
+        "Check resource usage patterns",
+        "Analyze database queries"
+    ),
+    'resource': _BASE_DEBUGGING_STEPS + (
+        "Monitor memory usage",
+        "Check for memory leaks",
+        "Verify resource cleanup"
+    )
+})
+
+# Root cause investigation path, wrapped in incident handling for critical errors
+_INVESTIGATION_PATH = (
+    "Review error context and stack trace",
+    "Check recent deployments or changes",
+    "Verify environment configuration"
+)
+
+_CRITICAL_INVESTIGATION_PATH = ("Immediate incident response",) + _INVESTIGATION_PATH + ("Post-mortem analysis",)
+
+# Area-independent parts of a self-improvement plan
+_IMPROVEMENT_ACTIONS = (
+    "Analyze real debugging cases",
+    "Practice root cause analysis techniques"
+)
+
+_IMPROVEMENT_METRICS = ('accuracy', 'resolution_time')
+
+# Quoted file path of a stack trace frame
+_TRACE_FILE_RE = re.compile(r'File "([^"\n]+)"')
+
+# Read-only after construction, so shared by every DebuggingAgent instance
+_CAPABILITIES = (
+    'error_analysis',
+    'debugging',
+    'root_cause_analysis',
+    'fix_generation',
+    'performance_debugging'
+)
+
+_CONFIG = MappingProxyType({
+    'learning_rate': 0.25,
+    'autonomy_level': 'high',
+    'debugging_approaches': ('log_analysis', 'code_inspection', 'runtime_analysis'),
+    'error_categories': ('syntax', 'runtime', 'logical', 'performance')
+})
+
 class DebuggingAgent(BaseAgent):
     """AI agent specialized in debugging and error resolution"""
     
+    __slots__ = ('_analysis_cache',)
+    
     def __init__(self, agent_id: str = None):
-        capabilities = [
-            'error_analysis',
-            'debugging',
-            'root_cause_analysis',
-            'fix_generation',
-            'performance_debugging'
-        ]
+        super().__init__(agent_id, "DebuggingAgent", _CAPABILITIES, dict(_CONFIG))
         
-        config = {
-            'learning_rate': 0.25,
-            'autonomy_level': 'high',
-            'debugging_approaches': ['log_analysis', 'code_inspection', 'runtime_analysis'],
-            'error_categories': ['syntax', 'runtime', 'logical', 'performance']
-        }
-        
-        super().__init__(agent_id, "DebuggingAgent", capabilities, config)
+        # (error_type, message, stack_trace) -> memory-independent part of the analysis
+        self._analysis_cache: 'OrderedDict[tuple, Dict[str, Any]]' = OrderedDict()
         
     async def process_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Process debugging tasks"""
         error_info = task.get('error_info', {})
         code_context = task.get('code_context', '')
         
-        error_analysis = await self._analyze_error(error_info, code_context)
-        root_cause = await self._identify_root_cause(error_analysis)
-        fixes = await self._generate_fixes(root_cause, code_context)
-        prevention_strategy = await self._create_prevention_strategy(error_analysis)
+        error_analysis = self._analyze_error(error_info, code_context)
+        root_cause = self._identify_root_cause(error_analysis)
+        fixes = self._generate_fixes(root_cause, code_context)
+        prevention_strategy = self._create_prevention_strategy(error_analysis)
         
         return {
             'status': 'success',
@@ -39,43 +157,58 @@ class DebuggingAgent(BaseAgent):
             'root_cause': root_cause,
             'proposed_fixes': fixes,
             'prevention_strategy': prevention_strategy,
-            'confidence_level': await self._calculate_confidence(error_analysis, fixes),
-            'debugging_steps': await self._suggest_debugging_steps(error_analysis)
+            'confidence_level': self._calculate_confidence(error_analysis, fixes),
+            'debugging_steps': self._suggest_debugging_steps(error_analysis)
         }
     
-    async def _analyze_error(self, error_info: Dict, code_context: str) -> Dict[str, Any]:
+    def _analyze_error(self, error_info: Dict, code_context: str) -> Dict[str, Any]:
         """Analyze error information and code context"""
-        error_type = error_info.get('type', 'unknown')
-        error_message = error_info.get('message', '')
-        stack_trace = error_info.get('stack_trace', '')
+        get = error_info.get
+        error_type = get('type', 'unknown')
+        error_message = get('message', '')
+        stack_trace = get('stack_trace', '')
+        
+        # Lower-cased once for all keyword checks
+        message_lower = error_message.lower()
         
-        analysis = {
+        # Replayed errors (retries, CI reruns) reuse the cached analysis; code_context
+        # is left out of the key because none of the cached parts depend on it
+        cache_key = (error_type, error_message, stack_trace)
+        cached = self._analysis_cache.get(cache_key)
+        
+        if cached is None:
+            cached = {
+                'error_category': self._categorize_error(error_type, message_lower),
+                'likely_causes': tuple(self._identify_likely_causes(error_type, error_message, message_lower, code_context)),
+                'severity': self._assess_severity(error_type, message_lower),
+                'affected_components': self._identify_affected_components(stack_trace, code_context)
+            }
+            self._analysis_cache[cache_key] = cached
+            if len(self._analysis_cache) > ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
+        else:
+            self._analysis_cache.move_to_end(cache_key)
+        
+        return {
             'error_type': error_type,
-            'error_category': await self._categorize_error(error_type, error_message),
-            'likely_causes': await self._identify_likely_causes(error_type, error_message, code_context),
-            'severity': await self._assess_severity(error_type, error_message),
-            'affected_components': await self._identify_affected_components(stack_trace, code_context),
-            'pattern_match': await self._check_known_patterns(error_type, error_message)
+            **cached,
+            # Depends on learned patterns, so it is never cached
+            'pattern_match': self._check_known_patterns(error_type, message_lower)
         }
-        
-        return analysis
     
-    async def _categorize_error(self, error_type: str, error_message: str) -> str:
+    def _categorize_error(self, error_type: str, message_lower: str) -> str:
         """Categorize the error type"""
-        error_lower = error_message.lower()
-        
-        if 'syntax' in error_type.lower() or 'syntax' in error_lower:
+        if 'syntax' in error_type.lower():
             return 'syntax'
-        elif 'memory' in error_lower or 'stack' in error_lower:
-            return 'resource'
-        elif 'timeout' in error_lower or 'performance' in error_lower:
-            return 'performance'
-        elif 'import' in error_lower or 'module' in error_lower:
-            return 'dependency'
-        else:
-            return 'logical'
+        
+        message_length = len(message_lower)
+        for keyword, category in _CATEGORY_KEYWORDS:
+            if len(keyword) <= message_length and keyword in message_lower:
+                return category
+        
+        return 'logical'
     
-    async def _identify_likely_causes(self, error_type: str, error_message: str, code_context: str) -> List[str]:
+    def _identify_likely_causes(self, error_type: str, error_message: str, message_lower: str, code_context: str) -> List[str]:
         """Identify likely causes of the error"""
         causes = []
         
@@ -84,71 +217,59 @@ class DebuggingAgent(BaseAgent):
             causes.append("Uninitialized variable or missing return value")
             causes.append("Database query returned None unexpectedly")
             
-        if 'index out of range' in error_message.lower():
+        if 'index out of range' in message_lower:
             causes.append("Array/list access beyond bounds")
             causes.append("Empty collection accessed without check")
             
-        if 'key error' in error_message.lower():
+        if 'key error' in message_lower:
             causes.append("Dictionary key does not exist")
             causes.append("Missing configuration or data")
             
-        if 'division by zero' in error_message.lower():
+        if 'division by zero' in message_lower:
             causes.append("Unchecked divisor value")
             causes.append("Missing input validation")
             
         # Context-specific analysis
-        if 'import' in error_message.lower():
+        if 'import' in message_lower:
             causes.append("Missing dependency or incorrect import path")
             causes.append("Virtual environment not activated")
             
         return causes
     
-    async def _assess_severity(self, error_type: str, error_message: str) -> str:
+    def _assess_severity(self, error_type: str, message_lower: str) -> str:
         """Assess error severity"""
-        critical_indicators = ['memory', 'segmentation', 'core dumped', 'data loss']
-        high_indicators = ['timeout', 'performance', 'database connection']
-        
-        if any(indicator in error_message.lower() for indicator in critical_indicators):
+        if _CRITICAL_INDICATOR_RE.search(message_lower):
             return 'critical'
-        elif any(indicator in error_message.lower() for indicator in high_indicators):
+        elif _HIGH_INDICATOR_RE.search(message_lower):
             return 'high'
         else:
             return 'medium'
     
-    async def _identify_affected_components(self, stack_trace: str, code_context: str) -> List[str]:
+    def _identify_affected_components(self, stack_trace: str, code_context: str) -> tuple:
         """Identify affected components from stack trace"""
-        components = []
-        
-        # Simple component extraction from stack trace
-        lines = stack_trace.split('\n')
-        for line in lines:
-            if 'File "' in line:
-                # Extract filename
-                start = line.find('File "') + 6
-                end = line.find('"', start)
-                if start < end:
-                    filename = line[start:end]
-                    components.append(filename.split('/')[-1])  # Just the filename
-        
-        return list(set(components))  # Remove duplicates
+        # Simple component extraction from stack trace: just the file names, without duplicates,
+        # in the order they first appear in the trace
+        return tuple(dict.fromkeys(match.group(1).rpartition('/')[2] for match in _TRACE_FILE_RE.finditer(stack_trace)))
     
-    async def _check_known_patterns(self, error_type: str, error_message: str) -> Dict[str, Any]:
+    def _check_known_patterns(self, error_type: str, message_lower: str) -> Dict[str, Any]:
         """Check against known error patterns"""
-        known_patterns = self.memory.get('error_patterns', {})
+        # Only patterns learned for the same error type are candidates
+        known_patterns = self.memory.get('error_patterns', {}).get(error_type, ())
+        message_length = len(message_lower)
         
-        for pattern_id, pattern in known_patterns.items():
-            if (pattern.get('error_type') == error_type and 
-                pattern.get('message_fragment') in error_message):
+        for pattern in known_patterns:
+            fragment = pattern['message_fragment']
+            if len(fragment) <= message_length and fragment in message_lower:
                 return {
                     'pattern_match': True,
-                    'pattern_id': pattern_id,
+                    'pattern_id': f"{error_type}_{pattern['error_category']}",
                     'known_solution': pattern.get('solution'),
                     'occurrence_count': pattern.get('count', 0) + 1
                 }
         
         return {'pattern_match': False}
     
-    async def _identify_root_cause(self, error_analysis: Dict) -> Dict[str, Any]:
+    def _identify_root_cause(self, error_analysis: Dict) -> Dict[str, Any]:
         """Identify the root cause of the error"""
         likely_causes = error_analysis.get('likely_causes', [])
         
@@ -156,118 +277,52 @@ class DebuggingAgent(BaseAgent):
             'primary_cause': likely_causes[0] if likely_causes else "Unknown cause",
             'contributing_factors': likely_causes[1:] if len(likely_causes) > 1 else [],
             'confidence': 0.8 if likely_causes else 0.3,
-            'investigation_path': await self._suggest_investigation_path(error_analysis)
+            'investigation_path': self._suggest_investigation_path(error_analysis)
         }
     
-    async def _generate_fixes(self, root_cause: Dict, code_context: str) -> List[Dict[str, Any]]:
+    def _generate_fixes(self, root_cause: Dict, code_context: str) -> List[Dict[str, Any]]:
         """Generate potential fixes for the error"""
-        fixes = []
         primary_cause = root_cause.get('primary_cause', '')
         
-        if 'Uninitialized variable' in primary_cause:
-            fixes.append({
-                'type': 'code_fix',
-                'description': 'Add null check before accessing variable',
-                'code_example': 'if variable is not None:\n    # use variable',
-                'risk': 'low',
-                'effort': 'low'
-            })
-            
-        if 'Array/list access beyond bounds' in primary_cause:
-            fixes.append({
-                'type': 'code_fix',
-                'description': 'Add bounds checking before array access',
-                'code_example': 'if index < len(array):\n    value = array[index]',
-                'risk': 'low',
-                'effort': 'low'
-            })
-            
-        if 'Missing dependency' in primary_cause:
-            fixes.append({
-                'type': 'dependency_fix',
-                'description': 'Install missing package',
-                'command': 'pip install missing-package',
-                'risk': 'low',
-                'effort': 'low'
-            })
-        
-        return fixes
+        return [dict(fix) for cause_fragment, fix in _FIX_RULES if cause_fragment in primary_cause]
     
-    async def _create_prevention_strategy(self, error_analysis: Dict) -> Dict[str, Any]:
+    def _create_prevention_strategy(self, error_analysis: Dict) -> Dict[str, Any]:
         """Create strategy to prevent similar errors"""
         error_category = error_analysis.get('error_category')
         
-        strategies = {
-            'syntax': ['Use linters', 'Enable IDE syntax checking', 'Code review'],
-            'resource': ['Add resource monitoring', 'Implement cleanup handlers', 'Use context managers'],
-            'performance': ['Add performance tests', 'Monitor resource usage', 'Implement caching'],
-            'dependency': ['Use dependency management', 'Pin versions', 'Regular updates'],
-            'logical': ['Add unit tests', 'Code review', 'Static analysis']
-        }
-        
         return {
-            'immediate_actions': strategies.get(error_category, ['Code review', 'Add tests']),
-            'long_term_strategies': [
-                'Implement comprehensive testing',
-                'Add monitoring and alerting',
-                'Regular code quality assessments'
-            ],
-            'tools_recommendations': ['pylint', 'pytest', 'logging', 'monitoring_dashboard']
+            'immediate_actions': _PREVENTION_STRATEGIES.get(error_category, _DEFAULT_PREVENTION_STRATEGY),
+            'long_term_strategies': _LONG_TERM_STRATEGIES,
+            'tools_recommendations': _RECOMMENDED_TOOLS
         }
     
-    async def _calculate_confidence(self, error_analysis: Dict, fixes: List[Dict]) -> float:
+    def _calculate_confidence(self, error_analysis: Dict, fixes: List[Dict]) -> float:
         """Calculate confidence in the analysis and fixes"""
+        get = error_analysis.get
         base_confidence = 0.5
         
         # Increase confidence based on factors
-        if error_analysis.get('pattern_match', {}).get('pattern_match'):
+        if (get('pattern_match') or {}).get('pattern_match'):
             base_confidence += 0.3
             
-        if len(error_analysis.get('likely_causes', [])) > 0:
+        if get('likely_causes'):
             base_confidence += 0.1
             
-        if len(fixes) > 0:
+        if fixes:
             base_confidence += 0.1
             
         return min(1.0, base_confidence)
     
-    async def _suggest_debugging_steps(self, error_analysis: Dict) -> List[str]:
+    def _suggest_debugging_steps(self, error_analysis: Dict) -> tuple:
         """Suggest specific debugging steps"""
-        steps = [
-            "Reproduce the error consistently",
-            "Check recent code changes",
-            "Examine logs for additional context"
-        ]
-        
-        error_category = error_analysis.get('error_category')
-        if error_category == 'performance':
-            steps.extend([
-                "Profile code performance",
-                "Check resource usage patterns",
-                "Analyze database queries"
-            ])
-        elif error_category == 'resource':
-            steps.extend([
-                "Monitor memory usage",
-                "Check for memory leaks",
-                "Verify resource cleanup"
-            ])
-            
-        return steps
+        return _DEBUGGING_STEPS.get(error_analysis.get('error_category'), _BASE_DEBUGGING_STEPS)
     
-    async def _suggest_investigation_path(self, error_analysis: Dict) -> List[str]:
+    def _suggest_investigation_path(self, error_analysis: Dict) -> tuple:
         """Suggest investigation path for root cause analysis"""
-        path = [
-            "Review error context and stack trace",
-            "Check recent deployments or changes",
-            "Verify environment configuration"
-        ]
-        
         if error_analysis.get('severity') == 'critical':
-            path.insert(0, "Immediate incident response")
-            path.append("Post-mortem analysis")
-            
-        return path
+            return _CRITICAL_INVESTIGATION_PATH
+        
+        return _INVESTIGATION_PATH
     
     async def learn_from_experience(self, experience: Dict[str, Any]):
         """Learn from debugging experiences"""
@@ -275,31 +330,44 @@ class DebuggingAgent(BaseAgent):
             error_analysis = experience['error_analysis']
             root_cause = experience['root_cause']
             
-            # Store successful patterns
-            pattern_key = f"{error_analysis.get('error_type')}_{error_analysis.get('error_category')}"
+            # Store successful patterns, bucketed by error type; both come from a small
+            # vocabulary, so interning lets lookups compare by identity
+            error_type = error_analysis.get('error_type')
+            error_category = error_analysis.get('error_category')
+            if isinstance(error_type, str):
+                error_type = sys.intern(error_type)
+            if isinstance(error_category, str):
+                error_category = sys.intern(error_category)
             
-            if 'error_patterns' not in self.memory:
-                self.memory['error_patterns'] = {}
-                
-            self.memory['error_patterns'][pattern_key] = {
-                'error_type': error_analysis.get('error_type'),
-                'error_category': error_analysis.get('error_category'),
-                'message_fragment': experience.get('error_info', {}).get('message', '')[:50],
-                'solution': root_cause.get('primary_cause'),
-                'count': self.memory['error_patterns'].get(pattern_key, {}).get('count', 0) + 1
-            }
+            store = self.memory.get('error_patterns')
+            if store is None:
+                store = self.memory['error_patterns'] = OrderedDict()
+            
+            patterns = store.get(error_type)
+            if patterns is None:
+                if len(store) >= MAX_ERROR_PATTERN_TYPES:
+                    store.popitem(last=False)
+                patterns = store[error_type] = []
+            else:
+                store.move_to_end(error_type)
+            
+            pattern = next((p for p in patterns if p['error_category'] == error_category), None)
+            if pattern is None:
+                pattern = {'error_type': error_type, 'error_category': error_category, 'count': 0}
+                patterns.append(pattern)
+            
+            # Fragments are stored lower-cased to match the lower-cased messages
+            pattern['message_fragment'] = experience.get('error_info', {}).get('message', '')[:50].lower()
+            pattern['solution'] = root_cause.get('primary_cause')
+            pattern['count'] += 1
     
     async def _create_improvement_plan(self, area: str) -> Dict[str, Any]:
         """Create improvement plan for debugging"""
         return {
             'area': area,
             'plan': f"Improve {area} debugging capabilities",
-            'actions': [
-                f"Study common {area} error patterns",
-                "Analyze real debugging cases",
-                "Practice root cause analysis techniques"
-            ],
-            'metrics': ['accuracy', 'resolution_time'],
+            'actions': (f"Study common {area} error patterns", *_IMPROVEMENT_ACTIONS),
+            'metrics': _IMPROVEMENT_METRICS,
             'timeline': '1 week'
         }
     
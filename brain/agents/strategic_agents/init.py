@@ -1,11 +1,26 @@
-from .strategic_planning_agent import StrategicPlanningAgent
-from .risk_management_agent import RiskManagementAgent
-from .innovation_agent import InnovationAgent
-from .decision_support_agent import DecisionSupportAgent
+from importlib import import_module
+
+# Exported agent class -> submodule defining it, imported on first access (PEP 562)
+_LAZY_EXPORTS = {
+    'StrategicPlanningAgent': '.strategic_planning_agent',
+    'RiskManagementAgent': '.risk_management_agent',
+    'InnovationAgent': '.innovation_agent',
+    'DecisionSupportAgent': '.decision_support_agent'
+}
 
 __all__ = [
     'StrategicPlanningAgent',
-    'RiskManagementAgent', 
+    'RiskManagementAgent',
     'InnovationAgent',
     'DecisionSupportAgent'
 ]
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(import_module(module_name, __package__), name)
+    # Cache so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
@@ -1,7 +1,302 @@
-from typing import Dict, List, Any
+from typing import Dict, List, Any, NamedTuple
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from ..base_agent import CollaborativeAgent
 
+class _PlanContext(NamedTuple):
+    """Inputs a strategic plan depends on, read from the task once"""
+    industry: str
+    organization_type: str
+    objectives: tuple
+
+def _freeze_rows(*rows: Dict[str, Any]) -> tuple:
+    """Read-only view of template rows, so shared templates cannot be modified through a result"""
+    return tuple(MappingProxyType(row) for row in rows)
+
+def _copy_rows(rows: tuple) -> List[Dict[str, Any]]:
+    """Per-result dict copies of frozen template rows; the built plan is returned without further copying"""
+    return [dict(row) for row in rows]
+
+# Key results per objective keyword, checked in order
+_KEY_RESULT_TEMPLATES = MappingProxyType({
+    'market leadership': _freeze_rows(
+        {'metric': 'Market share', 'target': '25%', 'baseline': '10%'},
+        {'metric': 'Customer acquisition', 'target': '1000 new customers', 'baseline': '200'},
+        {'metric': 'Revenue growth', 'target': '50% YoY', 'baseline': '15%'}
+    ),
+    'innovation': _freeze_rows(
+        {'metric': 'New products launched', 'target': '5', 'baseline': '1'},
+        {'metric': 'R&D investment', 'target': '15% of revenue', 'baseline': '5%'},
+        {'metric': 'Patents filed', 'target': '10', 'baseline': '0'}
+    ),
+    'organization': _freeze_rows(
+        {'metric': 'Employee engagement', 'target': '85%', 'baseline': '70%'},
+        {'metric': 'Leadership development', 'target': '20 leaders trained', 'baseline': '5'},
+        {'metric': 'Process efficiency', 'target': '30% improvement', 'baseline': 'Current state'}
+    )
+})
+
+# (keyword, key results) pairs in precedence order, so lookups iterate a plain tuple
+_KEY_RESULT_KEYWORDS = tuple(_KEY_RESULT_TEMPLATES.items())
+
+_DEFAULT_KEY_RESULTS = _freeze_rows(
+    {'metric': 'Goal achievement', 'target': '100%', 'baseline': '0%'},
+    {'metric': 'Stakeholder satisfaction', 'target': '90%', 'baseline': '70%'}
+)
+
+# Objectives used when the task does not provide any
+_DEFAULT_OBJECTIVES = _freeze_rows(
+    {
+        'id': 'obj_1',
+        'objective': 'Achieve market leadership in target segments',
+        'key_results': _KEY_RESULT_TEMPLATES['market leadership'],
+        'timeframe': '24 months',
+        'priority': 'high'
+    },
+    {
+        'id': 'obj_2',
+        'objective': 'Drive innovation and product excellence',
+        'key_results': _KEY_RESULT_TEMPLATES['innovation'],
+        'timeframe': '18 months',
+        'priority': 'high'
+    },
+    {
+        'id': 'obj_3',
+        'objective': 'Build a high-performance organization',
+        'key_results': _KEY_RESULT_TEMPLATES['organization'],
+        'timeframe': '12 months',
+        'priority': 'medium'
+    }
+)
+
+# Initiative milestones per initiative type
+_MILESTONE_TEMPLATES = MappingProxyType({
+    'market_expansion': _freeze_rows(
+        {'phase': 'Research', 'duration': '3 months', 'deliverable': 'Market analysis report'},
+        {'phase': 'Planning', 'duration': '2 months', 'deliverable': 'Expansion strategy'},
+        {'phase': 'Execution', 'duration': '12 months', 'deliverable': 'Market entry'}
+    ),
+    'rnd': _freeze_rows(
+        {'phase': 'Foundation', 'duration': '6 months', 'deliverable': 'Research framework'},
+        {'phase': 'Development', 'duration': '12 months', 'deliverable': 'Prototypes'},
+        {'phase': 'Commercialization', 'duration': '6 months', 'deliverable': 'Product launch'}
+    )
+})
+
+_DEFAULT_MILESTONES = _freeze_rows(
+    {'phase': 'Planning', 'duration': '2 months', 'deliverable': 'Project plan'},
+    {'phase': 'Execution', 'duration': '6 months', 'deliverable': 'Implementation'},
+    {'phase': 'Review', 'duration': '1 month', 'deliverable': 'Performance review'}
+)
+
+# (objective keyword, initiatives launched for it); only the first matching keyword applies.
+# linked_objective is a placeholder filled per objective, kept here to fix the key order
+_OBJECTIVE_INITIATIVES = (
+    ('market', _freeze_rows(
+        {
+            'name': 'Market Expansion Initiative',
+            'description': 'Expand into new geographic markets and customer segments',
+            'linked_objective': None,
+            'duration': '18 months',
+            'budget_estimate': 'High',
+            'key_milestones': _MILESTONE_TEMPLATES['market_expansion']
+        },
+        {
+            'name': 'Competitive Intelligence Program',
+            'description': 'Systematic monitoring and analysis of competitor activities',
+            'linked_objective': None,
+            'duration': 'Ongoing',
+            'budget_estimate': 'Medium',
+            'key_milestones': _DEFAULT_MILESTONES
+        }
+    )),
+    ('innovation', _freeze_rows(
+        {
+            'name': 'R&D Excellence Program',
+            'description': 'Enhance research and development capabilities',
+            'linked_objective': None,
+            'duration': '24 months',
+            'budget_estimate': 'High',
+            'key_milestones': _MILESTONE_TEMPLATES['rnd']
+        },
+        {
+            'name': 'Innovation Lab',
+            'description': 'Create dedicated space for experimentation and prototyping',
+            'linked_objective': None,
+            'duration': '12 months',
+            'budget_estimate': 'Medium',
+            'key_milestones': _DEFAULT_MILESTONES
+        }
+    ))
+)
+
+# Initiative duration -> index of the implementation phase it is scheduled in
+_PHASE_BY_DURATION = MappingProxyType({
+    '6 months': 0,
+    'Ongoing': 0,
+    '12 months': 1,
+    '18 months': 1,
+    '24 months': 2
+})
+
+_STRATEGIC_METRICS = MappingProxyType({
+    'financial_metrics': _freeze_rows(
+        {'metric': 'Revenue growth', 'target': '20% YoY', 'frequency': 'Quarterly'},
+        {'metric': 'Profit margin', 'target': '15%', 'frequency': 'Monthly'},
+        {'metric': 'Return on investment', 'target': '25%', 'frequency': 'Annual'}
+    ),
+    'customer_metrics': _freeze_rows(
+        {'metric': 'Customer satisfaction', 'target': '90%', 'frequency': 'Quarterly'},
+        {'metric': 'Net promoter score', 'target': '50', 'frequency': 'Bi-annual'},
+        {'metric': 'Customer retention', 'target': '85%', 'frequency': 'Monthly'}
+    ),
+    'operational_metrics': _freeze_rows(
+        {'metric': 'Product quality', 'target': '99%', 'frequency': 'Monthly'},
+        {'metric': 'Time to market', 'target': 'Reduce by 30%', 'frequency': 'Quarterly'},
+        {'metric': 'Employee productivity', 'target': 'Improve by 15%', 'frequency': 'Annual'}
+    )
+})
+
+class _IndustryProfile(NamedTuple):
+    """Everything in a plan that depends only on the industry, resolved with one lookup per plan"""
+    vision: str
+    mission: str
+    core_values: tuple
+
+# Vision / mission statements are filled in with the industry and organization type
+_INDUSTRY_PROFILES = MappingProxyType({
+    'technology': _IndustryProfile(
+        vision="To be the leading {industry} solution provider, transforming how businesses operate through innovation",
+        mission="To deliver cutting-edge {industry} solutions that drive efficiency, growth, and competitive advantage for our clients",
+        core_values=(
+            'Innovation and Creativity',
+            'Excellence in Execution',
+            'Customer Centricity',
+            'Continuous Learning',
+            'Collaborative Spirit'
+        )
+    ),
+    'healthcare': _IndustryProfile(
+        vision="To create a world where {industry} services are accessible, affordable, and effective for everyone",
+        mission="To provide exceptional {industry} services that improve lives and advance medical care through innovation and compassion",
+        core_values=(
+            'Compassionate Care',
+            'Clinical Excellence',
+            'Patient Safety',
+            'Integrity and Ethics',
+            'Continuous Improvement'
+        )
+    )
+})
+
+_DEFAULT_INDUSTRY_PROFILE = _IndustryProfile(
+    vision="To become the most respected and successful {organization_type} in our industry",
+    mission="To deliver outstanding value to our customers through excellence in {industry} and unwavering commitment to quality",
+    core_values=(
+        'Integrity',
+        'Excellence',
+        'Innovation',
+        'Customer Focus',
+        'Teamwork'
+    )
+)
+
+# Parts of the resource estimate that do not scale with the number of initiatives
+_INVESTMENT_BREAKDOWN = MappingProxyType({
+    'personnel': '60%',
+    'technology': '20%',
+    'marketing': '10%',
+    'contingency': '10%'
+})
+
+_KEY_ROLES = ('Project Managers', 'Subject Matter Experts', 'Analysts', 'Coordinators')
+
+_SKILL_REQUIREMENTS = ('Strategic thinking', 'Project management', 'Analytical skills')
+
+_TECHNOLOGY_REQUIREMENTS = (
+    'Project management software',
+    'Analytics and reporting tools',
+    'Collaboration platforms',
+    'Performance monitoring systems'
+)
+
+# Plan sections shared by every plan; frozen here and copied once per result by their helpers
+_STRATEGIC_RISKS = _freeze_rows(
+    {
+        'risk_category': 'Market',
+        'specific_risk': 'Changing customer preferences',
+        'likelihood': 'Medium',
+        'impact': 'High',
+        'mitigation': 'Continuous market research and agile adaptation'
+    },
+    {
+        'risk_category': 'Competitive',
+        'specific_risk': 'New market entrants',
+        'likelihood': 'High',
+        'impact': 'Medium',
+        'mitigation': 'Build strong competitive advantages and barriers to entry'
+    },
+    {
+        'risk_category': 'Operational',
+        'specific_risk': 'Execution capability gaps',
+        'likelihood': 'Medium',
+        'impact': 'High',
+        'mitigation': 'Invest in capability building and strategic partnerships'
+    },
+    {
+        'risk_category': 'Financial',
+        'specific_risk': 'Funding constraints',
+        'likelihood': 'Low',
+        'impact': 'High',
+        'mitigation': 'Maintain financial discipline and diverse funding sources'
+    }
+)
+
+_KEY_STAKEHOLDERS = _freeze_rows(
+    {
+        'group': 'Executive Leadership',
+        'role': 'Strategy approval and oversight',
+        'engagement_approach': 'Regular strategy reviews and decision forums'
+    },
+    {
+        'group': 'Employees',
+        'role': 'Strategy execution',
+        'engagement_approach': 'Clear communication, training, and involvement in planning'
+    },
+    {
+        'group': 'Customers',
+        'role': 'Strategy validation and feedback',
+        'engagement_approach': 'Customer advisory boards and feedback mechanisms'
+    },
+    {
+        'group': 'Investors/Board',
+        'role': 'Governance and resource allocation',
+        'engagement_approach': 'Regular updates and performance reporting'
+    }
+)
+
+_COMMUNICATION_PLAN = MappingProxyType({
+    'audience_segments': MappingProxyType({
+        'internal': ('Leadership', 'Managers', 'Employees'),
+        'external': ('Customers', 'Partners', 'Investors', 'Media')
+    }),
+    'communication_channels': MappingProxyType({
+        'internal': ('Town halls', 'Intranet', 'Team meetings', 'Newsletters'),
+        'external': ('Website', 'Press releases', 'Social media', 'Industry events')
+    }),
+    'key_messages': (
+        'Our vision for the future',
+        'Strategic priorities and objectives',
+        'Expected benefits and outcomes',
+        'Role of each stakeholder group'
+    ),
+    'timeline': MappingProxyType({
+        'initial_launch': '1 month',
+        'ongoing_updates': 'Quarterly',
+        'major_reviews': 'Annual'
+    })
+})
+
 class StrategicPlanningAgent(CollaborativeAgent):
     """AI agent specialized in strategic planning and long-term vision"""
     
@@ -41,384 +336,181 @@ class StrategicPlanningAgent(CollaborativeAgent):
     async def _develop_strategic_plan(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Develop comprehensive strategic plan"""
         context = task.get('context', {})
-        objectives = task.get('objectives', [])
-        constraints = task.get('constraints', [])
         
-        vision_mission = await self._define_vision_mission(context)
-        strategic_objectives = await self._set_strategic_objectives(objectives)
-        initiatives = await self._define_strategic_initiatives(strategic_objectives)
-        metrics = await self._define_strategic_metrics(strategic_objectives)
+        plan_context = _PlanContext(
+            industry=context.get('industry', ''),
+            organization_type=context.get('organization_type', 'company'),
+            objectives=tuple(task.get('objectives', ()))
+        )
+        
+        return self._build_strategic_plan(plan_context)
+    
+    def _build_strategic_plan(self, plan_context: _PlanContext) -> Dict[str, Any]:
+        """Build the strategic plan for a plan context"""
+        # All industry-specific content is resolved with a single lookup
+        profile = _INDUSTRY_PROFILES.get(plan_context.industry.lower(), _DEFAULT_INDUSTRY_PROFILE)
+        
+        vision_mission = self._define_vision_mission(profile, plan_context)
+        strategic_objectives = self._set_strategic_objectives(plan_context.objectives)
+        initiatives = self._define_strategic_initiatives(strategic_objectives)
+        metrics = self._define_strategic_metrics(strategic_objectives)
         
         return {
             'status': 'success',
             'strategic_plan': {
                 'vision': vision_mission['vision'],
                 'mission': vision_mission['mission'],
-                'core_values': await self._define_core_values(context),
+                'core_values': self._define_core_values(profile),
                 'time_horizon': '3-5 years',
                 'strategic_objectives': strategic_objectives,
                 'key_initiatives': initiatives,
                 'success_metrics': metrics
             },
             'implementation_guidance': {
-                'phased_approach': await self._create_phased_approach(initiatives),
-                'resource_requirements': await self._estimate_resource_requirements(initiatives),
-                'risk_assessment': await self._assess_strategic_risks(strategic_objectives)
+                'phased_approach': self._create_phased_approach(initiatives),
+                'resource_requirements': self._estimate_resource_requirements(initiatives),
+                'risk_assessment': self._assess_strategic_risks(strategic_objectives)
             },
             'stakeholder_considerations': {
-                'key_stakeholders': await self._identify_key_stakeholders(context),
-                'communication_plan': await self._create_communication_plan()
+                'key_stakeholders': self._identify_key_stakeholders(),
+                'communication_plan': self._create_communication_plan()
             }
         }
     
-    async def _define_vision_mission(self, context: Dict[str, Any]) -> Dict[str, str]:
+    def _define_vision_mission(self, profile: _IndustryProfile, plan_context: _PlanContext) -> Dict[str, str]:
         """Define vision and mission statements"""
-        industry = context.get('industry', '')
-        organization_type = context.get('organization_type', 'company')
-        
-        vision_templates = {
-            'technology': f"To be the leading {industry} solution provider, transforming how businesses operate through innovation",
-            'healthcare': f"To create a world where {industry} services are accessible, affordable, and effective for everyone",
-            'default': f"To become the most respected and successful {organization_type} in our industry"
-        }
-        
-        mission_templates = {
-            'technology': f"To deliver cutting-edge {industry} solutions that drive efficiency, growth, and competitive advantage for our clients",
-            'healthcare': f"To provide exceptional {industry} services that improve lives and advance medical care through innovation and compassion",
-            'default': f"To deliver outstanding value to our customers through excellence in {industry} and unwavering commitment to quality"
-        }
-        
-        vision = vision_templates.get(industry.lower(), vision_templates['default'])
-        mission = mission_templates.get(industry.lower(), mission_templates['default'])
+        industry = plan_context.industry
+        organization_type = plan_context.organization_type
         
         return {
-            'vision': vision,
-            'mission': mission
+            'vision': profile.vision.format(industry=industry, organization_type=organization_type),
+            'mission': profile.mission.format(industry=industry, organization_type=organization_type)
         }
     
-    async def _set_strategic_objectives(self, user_objectives: List[str]) -> List[Dict[str, Any]]:
+    def _set_strategic_objectives(self, user_objectives: List[str]) -> List[Dict[str, Any]]:
         """Set strategic objectives using OKR framework"""
         if user_objectives:
             # Use provided objectives
-            objectives = []
-            for i, objective in enumerate(user_objectives):
-                objectives.append({
+            lookup_key_results = self._lookup_key_results
+            return [
+                {
                     'id': f"obj_{i+1}",
                     'objective': objective,
-                    'key_results': await self._generate_key_results(objective),
+                    'key_results': lookup_key_results(objective.lower()),
                     'timeframe': '12 months',
                     'priority': 'high' if i == 0 else 'medium'
-                })
-            return objectives
+                }
+                for i, objective in enumerate(user_objectives)
+            ]
         
         # Default strategic objectives
         return [
-            {
-                'id': 'obj_1',
-                'objective': 'Achieve market leadership in target segments',
-                'key_results': await self._generate_key_results('market leadership'),
-                'timeframe': '24 months',
-                'priority': 'high'
-            },
-            {
-                'id': 'obj_2',
-                'objective': 'Drive innovation and product excellence',
-                'key_results': await self._generate_key_results('innovation'),
-                'timeframe': '18 months',
-                'priority': 'high'
-            },
-            {
-                'id': 'obj_3',
-                'objective': 'Build a high-performance organization',
-                'key_results': await self._generate_key_results('organization'),
-                'timeframe': '12 months',
-                'priority': 'medium'
-            }
+            {**objective, 'key_results': _copy_rows(objective['key_results'])}
+            for objective in _DEFAULT_OBJECTIVES
         ]
     
-    async def _generate_key_results(self, objective: str) -> List[Dict[str, Any]]:
-        """Generate key results for objectives"""
-        kr_templates = {
-            'market leadership': [
-                {'metric': 'Market share', 'target': '25%', 'baseline': '10%'},
-                {'metric': 'Customer acquisition', 'target': '1000 new customers', 'baseline': '200'},
-                {'metric': 'Revenue growth', 'target': '50% YoY', 'baseline': '15%'}
-            ],
-            'innovation': [
-                {'metric': 'New products launched', 'target': '5', 'baseline': '1'},
-                {'metric': 'R&D investment', 'target': '15% of revenue', 'baseline': '5%'},
-                {'metric': 'Patents filed', 'target': '10', 'baseline': '0'}
-            ],
-            'organization': [
-                {'metric': 'Employee engagement', 'target': '85%', 'baseline': '70%'},
-                {'metric': 'Leadership development', 'target': '20 leaders trained', 'baseline': '5'},
-                {'metric': 'Process efficiency', 'target': '30% improvement', 'baseline': 'Current state'}
-            ]
-        }
-        
+    def _lookup_key_results(self, objective_lower: str) -> List[Dict[str, Any]]:
+        """Look up key results for a lower-cased objective"""
         # Find matching template or use default
-        for key, template in kr_templates.items():
-            if key in objective.lower():
-                return template
+        for key, template in _KEY_RESULT_KEYWORDS:
+            if key in objective_lower:
+                return _copy_rows(template)
         
         # Default key results
-        return [
-            {'metric': 'Goal achievement', 'target': '100%', 'baseline': '0%'},
-            {'metric': 'Stakeholder satisfaction', 'target': '90%', 'baseline': '70%'}
-        ]
+        return _copy_rows(_DEFAULT_KEY_RESULTS)
     
-    async def _define_strategic_initiatives(self, objectives: List[Dict]) -> List[Dict[str, Any]]:
+    def _define_strategic_initiatives(self, objectives: List[Dict]) -> List[Dict[str, Any]]:
         """Define strategic initiatives to achieve objectives"""
         initiatives = []
+        add_initiative = initiatives.append
         
         for objective in objectives:
             obj_id = objective['id']
-            obj_text = objective['objective']
+            obj_text = objective['objective'].lower()
             
-            if 'market' in obj_text.lower():
-                initiatives.extend([
-                    {
-                        'name': 'Market Expansion Initiative',
-                        'description': 'Expand into new geographic markets and customer segments',
-                        'linked_objective': obj_id,
-                        'duration': '18 months',
-                        'budget_estimate': 'High',
-                        'key_milestones': await self._generate_initiative_milestones('market_expansion')
-                    },
-                    {
-                        'name': 'Competitive Intelligence Program',
-                        'description': 'Systematic monitoring and analysis of competitor activities',
-                        'linked_objective': obj_id,
-                        'duration': 'Ongoing',
-                        'budget_estimate': 'Medium',
-                        'key_milestones': await self._generate_initiative_milestones('intelligence')
-                    }
-                ])
-            elif 'innovation' in obj_text.lower():
-                initiatives.extend([
-                    {
-                        'name': 'R&D Excellence Program',
-                        'description': 'Enhance research and development capabilities',
-                        'linked_objective': obj_id,
-                        'duration': '24 months',
-                        'budget_estimate': 'High',
-                        'key_milestones': await self._generate_initiative_milestones('rnd')
-                    },
-                    {
-                        'name': 'Innovation Lab',
-                        'description': 'Create dedicated space for experimentation and prototyping',
-                        'linked_objective': obj_id,
-                        'duration': '12 months',
-                        'budget_estimate': 'Medium',
-                        'key_milestones': await self._generate_initiative_milestones('innovation_lab')
-                    }
-                ])
+            for keyword, templates in _OBJECTIVE_INITIATIVES:
+                if keyword in obj_text:
+                    for template in templates:
+                        add_initiative({
+                            **template,
+                            'linked_objective': obj_id,
+                            'key_milestones': _copy_rows(template['key_milestones'])
+                        })
+                    break
         
         return initiatives
     
-    async def _generate_initiative_milestones(self, initiative_type: str) -> List[Dict[str, Any]]:
-        """Generate milestones for strategic initiatives"""
-        milestone_templates = {
-            'market_expansion': [
-                {'phase': 'Research', 'duration': '3 months', 'deliverable': 'Market analysis report'},
-                {'phase': 'Planning', 'duration': '2 months', 'deliverable': 'Expansion strategy'},
-                {'phase': 'Execution', 'duration': '12 months', 'deliverable': 'Market entry'}
-            ],
-            'rnd': [
-                {'phase': 'Foundation', 'duration': '6 months', 'deliverable': 'Research framework'},
-                {'phase': 'Development', 'duration': '12 months', 'deliverable': 'Prototypes'},
-                {'phase': 'Commercialization', 'duration': '6 months', 'deliverable': 'Product launch'}
-            ]
-        }
-        
-        return milestone_templates.get(initiative_type, [
-            {'phase': 'Planning', 'duration': '2 months', 'deliverable': 'Project plan'},
-            {'phase': 'Execution', 'duration': '6 months', 'deliverable': 'Implementation'},
-            {'phase': 'Review', 'duration': '1 month', 'deliverable': 'Performance review'}
-        ])
-    
-    async def _define_strategic_metrics(self, objectives: List[Dict]) -> Dict[str, Any]:
+    def _define_strategic_metrics(self, objectives: List[Dict]) -> Dict[str, Any]:
         """Define strategic performance metrics"""
-        return {
-            'financial_metrics': [
-                {'metric': 'Revenue growth', 'target': '20% YoY', 'frequency': 'Quarterly'},
-                {'metric': 'Profit margin', 'target': '15%', 'frequency': 'Monthly'},
-                {'metric': 'Return on investment', 'target': '25%', 'frequency': 'Annual'}
-            ],
-            'customer_metrics': [
-                {'metric': 'Customer satisfaction', 'target': '90%', 'frequency': 'Quarterly'},
-                {'metric': 'Net promoter score', 'target': '50', 'frequency': 'Bi-annual'},
-                {'metric': 'Customer retention', 'target': '85%', 'frequency': 'Monthly'}
-            ],
-            'operational_metrics': [
-                {'metric': 'Product quality', 'target': '99%', 'frequency': 'Monthly'},
-                {'metric': 'Time to market', 'target': 'Reduce by 30%', 'frequency': 'Quarterly'},
-                {'metric': 'Employee productivity', 'target': 'Improve by 15%', 'frequency': 'Annual'}
-            ]
-        }
+        return {category: _copy_rows(rows) for category, rows in _STRATEGIC_METRICS.items()}
     
-    async def _define_core_values(self, context: Dict[str, Any]) -> List[str]:
+    def _define_core_values(self, profile: _IndustryProfile) -> tuple:
         """Define organizational core values"""
-        industry = context.get('industry', '')
-        
-        value_sets = {
-            'technology': [
-                'Innovation and Creativity',
-                'Excellence in Execution',
-                'Customer Centricity',
-                'Continuous Learning',
-                'Collaborative Spirit'
-            ],
-            'healthcare': [
-                'Compassionate Care',
-                'Clinical Excellence',
-                'Patient Safety',
-                'Integrity and Ethics',
-                'Continuous Improvement'
-            ],
-            'default': [
-                'Integrity',
-                'Excellence',
-                'Innovation',
-                'Customer Focus',
-                'Teamwork'
-            ]
-        }
-        
-        return value_sets.get(industry.lower(), value_sets['default'])
+        return profile.core_values
     
-    async def _create_phased_approach(self, initiatives: List[Dict]) -> Dict[str, Any]:
+    def _create_phased_approach(self, initiatives: List[Dict]) -> Dict[str, Any]:
         """Create phased implementation approach"""
+        # Bucket initiatives by phase in a single pass
+        phase_1, phase_2, phase_3 = phase_initiatives = ([], [], [])
+        for init in initiatives:
+            phase = _PHASE_BY_DURATION.get(init['duration'])
+            if phase is not None:
+                phase_initiatives[phase].append(init)
+        
         phases = {
             'phase_1': {
                 'name': 'Foundation Building',
                 'duration': '6 months',
                 'focus_areas': ['Strategy finalization', 'Team assembly', 'Process setup'],
-                'initiatives': [init for init in initiatives if init['duration'] in ['6 months', 'Ongoing']]
+                'initiatives': phase_1
             },
             'phase_2': {
                 'name': 'Core Implementation',
                 'duration': '12 months',
                 'focus_areas': ['Major initiative rollout', 'Capability building', 'Performance tracking'],
-                'initiatives': [init for init in initiatives if init['duration'] in ['12 months', '18 months']]
+                'initiatives': phase_2
             },
             'phase_3': {
                 'name': 'Scale and Optimize',
                 'duration': '12 months',
                 'focus_areas': ['Expansion', 'Optimization', 'Innovation scaling'],
-                'initiatives': [init for init in initiatives if init['duration'] in ['24 months']]
+                'initiatives': phase_3
             }
         }
         
         return phases
     
-    async def _estimate_resource_requirements(self, initiatives: List[Dict]) -> Dict[str, Any]:
+    def _estimate_resource_requirements(self, initiatives: List[Dict]) -> Dict[str, Any]:
         """Estimate resource requirements for strategic initiatives"""
         total_initiatives = len(initiatives)
         
         return {
             'financial_investment': {
                 'estimated_total': total_initiatives * 500000,  # Simplified estimation
-                'breakdown': {
-                    'personnel': '60%',
-                    'technology': '20%',
-                    'marketing': '10%',
-                    'contingency': '10%'
-                }
+                'breakdown': dict(_INVESTMENT_BREAKDOWN)
             },
             'human_resources': {
                 'estimated_team_size': total_initiatives * 5,
-                'key_roles': ['Project Managers', 'Subject Matter Experts', 'Analysts', 'Coordinators'],
-                'skill_requirements': ['Strategic thinking', 'Project management', 'Analytical skills']
+                'key_roles': _KEY_ROLES,
+                'skill_requirements': _SKILL_REQUIREMENTS
             },
-            'technology_requirements': [
-                'Project management software',
-                'Analytics and reporting tools',
-                'Collaboration platforms',
-                'Performance monitoring systems'
-            ]
+            'technology_requirements': _TECHNOLOGY_REQUIREMENTS
         }
     
-    async def _assess_strategic_risks(self, objectives: List[Dict]) -> List[Dict[str, Any]]:
+    def _assess_strategic_risks(self, objectives: List[Dict]) -> List[Dict[str, Any]]:
         """Assess strategic risks"""
-        return [
-            {
-                'risk_category': 'Market',
-                'specific_risk': 'Changing customer preferences',
-                'likelihood': 'Medium',
-                'impact': 'High',
-                'mitigation': 'Continuous market research and agile adaptation'
-            },
-            {
-                'risk_category': 'Competitive',
-                'specific_risk': 'New market entrants',
-                'likelihood': 'High',
-                'impact': 'Medium',
-                'mitigation': 'Build strong competitive advantages and barriers to entry'
-            },
-            {
-                'risk_category': 'Operational',
-                'specific_risk': 'Execution capability gaps',
-                'likelihood': 'Medium',
-                'impact': 'High',
-                'mitigation': 'Invest in capability building and strategic partnerships'
-            },
-            {
-                'risk_category': 'Financial',
-                'specific_risk': 'Funding constraints',
-                'likelihood': 'Low',
-                'impact': 'High',
-                'mitigation': 'Maintain financial discipline and diverse funding sources'
-            }
-        ]
+        return _copy_rows(_STRATEGIC_RISKS)
     
-    async def _identify_key_stakeholders(self, context: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _identify_key_stakeholders(self) -> List[Dict[str, Any]]:
         """Identify key stakeholders"""
-        return [
-            {
-                'group': 'Executive Leadership',
-                'role': 'Strategy approval and oversight',
-                'engagement_approach': 'Regular strategy reviews and decision forums'
-            },
-            {
-                'group': 'Employees',
-                'role': 'Strategy execution',
-                'engagement_approach': 'Clear communication, training, and involvement in planning'
-            },
-            {
-                'group': 'Customers',
-                'role': 'Strategy validation and feedback',
-                'engagement_approach': 'Customer advisory boards and feedback mechanisms'
-            },
-            {
-                'group': 'Investors/Board',
-                'role': 'Governance and resource allocation',
-                'engagement_approach': 'Regular updates and performance reporting'
-            }
-        ]
+        return _copy_rows(_KEY_STAKEHOLDERS)
     
-    async def _create_communication_plan(self) -> Dict[str, Any]:
+    def _create_communication_plan(self) -> Dict[str, Any]:
         """Create strategic communication plan"""
+        # Nested sections are read-only views; the string tuples are immutable and shared as-is
         return {
-            'audience_segments': {
-                'internal': ['Leadership', 'Managers', 'Employees'],
-                'external': ['Customers', 'Partners', 'Investors', 'Media']
-            },
-            'communication_channels': {
-                'internal': ['Town halls', 'Intranet', 'Team meetings', 'Newsletters'],
-                'external': ['Website', 'Press releases', 'Social media', 'Industry events']
-            },
-            'key_messages': [
-                'Our vision for the future',
-                'Strategic priorities and objectives',
-                'Expected benefits and outcomes',
-                'Role of each stakeholder group'
-            ],
-            'timeline': {
-                'initial_launch': '1 month',
-                'ongoing_updates': 'Quarterly',
-                'major_reviews': 'Annual'
-            }
+            section: dict(value) if isinstance(value, MappingProxyType) else value
+            for section, value in _COMMUNICATION_PLAN.items()
         }
     
     async def learn_from_experience(self, experience: Dict[str, Any]):
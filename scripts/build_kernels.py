@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Advanced AI System - Kernel Builder
+Ahead-of-time compiles the market analysis numeric kernels with numba.pycc
+so agents can use them without JIT compilation at startup
+"""
+
+import sys
+from pathlib import Path
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from numba.pycc import CC
+
+from brain.agents.business_agents import _kernels
+
+OUTPUT_DIR = Path(__file__).parent.parent / 'brain' / 'agents' / 'business_agents'
+
+def build():
+    cc = CC('_market_kernels')
+    cc.output_dir = str(OUTPUT_DIR)
+    cc.verbose = True
+    
+    # Export the pure-Python source of the JIT kernel
+    compute_shares = getattr(_kernels.compute_shares, 'py_func', _kernels.compute_shares)
+    cc.export('compute_shares', 'f8[:](b1[:])')(compute_shares)
+    
+    cc.compile()
+
+if __name__ == "__main__":
+    build()
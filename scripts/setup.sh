@@ -91,7 +91,7 @@ install_dependencies() {
     
     # Data processing
     log_info "Installing data processing libraries..."
-    pip install numpy pandas scikit-learn
+    pip install numpy numba pyahocorasick pandas scikit-learn
     pip install matplotlib seaborn plotly
     
     # System and utilities
@@ -114,6 +114,17 @@ install_dependencies() {
     log_success "All Python dependencies installed"
 }
 
+# Ahead-of-time compile numeric kernels
+build_kernels() {
+    log_info "Compiling numeric kernels..."
+    
+    if python scripts/build_kernels.py; then
+        log_success "Numeric kernels compiled"
+    else
+        log_warning "Kernel compilation failed, agents will use JIT/pure-Python kernels"
+    fi
+}
+
 # Create directory structure
 create_directories() {
     log_info "Creating directory structure..."
@@ -371,6 +382,7 @@ main() {
     setup_venv
     upgrade_pip
     install_dependencies
+    build_kernels
     create_directories
     create_config_files
     setup_pre_commit
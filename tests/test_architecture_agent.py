@@ -0,0 +1,21 @@
+import asyncio
+import copy
+import sys
+from pathlib import Path
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from brain.agents.coding_agents.architecture_agent import ArchitectureAgent
+
+def _design(agent, scale):
+    return asyncio.run(agent.process_task({'requirements': {'scale': scale}}))
+
+def test_scaling_milestones_are_not_shared_between_agents():
+    for scale in ('small', 'medium', 'large', 'planetary'):
+        expected = copy.deepcopy(_design(ArchitectureAgent('first'), scale))
+        
+        tampered = _design(ArchitectureAgent('second'), scale)
+        tampered['scalability_plan']['milestones'][0]['action'] = 'HACKED'
+        
+        assert _design(ArchitectureAgent('third'), scale) == expected
@@ -0,0 +1,43 @@
+import asyncio
+import copy
+import sys
+from pathlib import Path
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from brain.agents.strategic_agents.strategic_planning_agent import StrategicPlanningAgent
+
+TASK = {
+    'context': {'industry': 'Technology', 'organization_type': 'startup'},
+    'objectives': ['Grow market leadership', 'Drive innovation culture']
+}
+
+def _develop(agent, task=TASK):
+    return asyncio.run(agent.process_task(dict(task)))
+
+def _tamper(result):
+    plan = result['strategic_plan']
+    plan['vision'] = 'HACKED'
+    plan['strategic_objectives'][0]['objective'] = 'HACKED'
+    plan['strategic_objectives'][0]['key_results'][0]['metric'] = 'HACKED'
+    plan['key_initiatives'][0]['key_milestones'][0]['phase'] = 'HACKED'
+    plan['success_metrics']['financial_metrics'][0]['target'] = 'HACKED'
+    result['implementation_guidance']['risk_assessment'][0]['impact'] = 'HACKED'
+    result['stakeholder_considerations']['key_stakeholders'][0]['role'] = 'HACKED'
+    result['stakeholder_considerations']['communication_plan']['timeline']['major_reviews'] = 'HACKED'
+
+def test_repeated_plan_is_not_affected_by_mutating_a_result():
+    agent = StrategicPlanningAgent('planner')
+    expected = copy.deepcopy(_develop(agent))
+    
+    _tamper(_develop(agent))
+    
+    assert _develop(agent) == expected
+
+def test_templates_are_not_shared_between_agents():
+    for task in ({}, TASK):
+        expected = copy.deepcopy(_develop(StrategicPlanningAgent('first'), task))
+        _tamper(_develop(StrategicPlanningAgent('second'), task))
+        
+        assert _develop(StrategicPlanningAgent('third'), task) == expected